@@ -102,6 +102,10 @@ DATABASES = {
 }
 db_from_env = env.db(default=env("DATABASE_URL"))
 DATABASES["default"].update(db_from_env)
+# Persistent connections: without CONN_MAX_AGE every request pays a fresh
+# Postgres TCP + auth handshake before its first query
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
 
 
 
@@ -195,19 +199,35 @@ LOGLEVEL = env("LOGLEVEL")
 
 import logging
 import logging.config
+import orjson
 from django.utils.log import DEFAULT_LOGGING
 
-# Simple JSON formatter for logs (without external dependency)
+# Simple JSON formatter for logs (orjson is ~3-5x faster than stdlib json
+# and this runs once per log record on the request path)
 class SimpleJSONFormatter(logging.Formatter):
     def format(self, record):
-        import json
+        # Logging re-formats the same record once per handler; cache the
+        # result on the record so it is only serialized once
+        cached = getattr(record, '_jsonified', None)
+        if cached is not None:
+            return cached
         log_record = {
             'timestamp': self.formatTime(record),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
         }
-        return json.dumps(log_record)
+        # default=str covers datetimes/UUIDs that may land in log records
+        record._jsonified = orjson.dumps(log_record, default=str).decode()
+        return record._jsonified
+
+DEBUG_SQL = env("DEBUG_SQL")
+
+
+def _skip_sql_debug(record):
+    # Keep SQL query records out of the JSON formatter unless requested
+    return DEBUG_SQL or not record.name.startswith("django.db.backends")
+
 
 logging.config.dictConfig(
     {
@@ -220,11 +240,18 @@ logging.config.dictConfig(
             "json": {"()": SimpleJSONFormatter},
             "django.server": DEFAULT_LOGGING["formatters"]["django.server"],
         },
+        "filters": {
+            "skip_sql_debug": {
+                "()": "django.utils.log.CallbackFilter",
+                "callback": _skip_sql_debug,
+            },
+        },
         "handlers": {
             # console logs to stderr
             "console": {
                 "class": "logging.StreamHandler",
                 "formatter": "json" if not DEBUG else "default",
+                "filters": ["skip_sql_debug"],
             },
             "django.server": DEFAULT_LOGGING["handlers"]["django.server"],
         },
@@ -239,7 +266,7 @@ logging.config.dictConfig(
 LOG_REQUESTS = True
 
 # for printing queries on terminal
-if env("DEBUG_SQL"):
+if DEBUG_SQL:
     log = logging.getLogger("django.db.backends")
     log.setLevel(logging.DEBUG)
 
@@ -10,31 +10,31 @@ class JobsConfig(AppConfig):
         from jobs.inject import JobContainer
         import jobs.presentation.views
         import jobs.tasks
-        from jobs.domain.use_cases import (
-            create_job_use_case,
-            get_job_use_case,
-            list_jobs_use_case,
-            update_job_use_case,
-            cancel_job_use_case,
-            delete_job_use_case,
-            execute_remote_command_use_case,
-            execute_remote_command_streaming_use_case,
-            kill_remote_process_use_case,
-        )
+        # Warm the remaining lazy imports here so the first request doesn't
+        # pay them; with a preloading server the pages are also shared
+        # copy-on-write across workers
+        import jobs.infrastructure.remote_command_executor
+        import jobs.infrastructure.ssh_client
 
         self.inject_container = JobContainer()
+        # Use cases receive their dependencies explicitly from the container
+        # providers, so only the modules with Provide[...] markers need the
+        # (AST-walking, per-module) wiring pass
         self.inject_container.wire(
             modules=[
-                jobs.presentation.views,
                 jobs.tasks,
-                create_job_use_case,
-                get_job_use_case,
-                list_jobs_use_case,
-                update_job_use_case,
-                cancel_job_use_case,
-                delete_job_use_case,
-                execute_remote_command_use_case,
-                execute_remote_command_streaming_use_case,
-                kill_remote_process_use_case,
             ],
         )
+
+        # Resolve the view use cases once here instead of walking the
+        # container on every request; the providers are Singletons so each
+        # view shares one stateless instance
+        container = self.inject_container
+        views = jobs.presentation.views
+        views.CreateJobView.create_job_use_case = container.create_job_use_case()
+        views.BulkCreateJobsView.bulk_create_jobs_use_case = container.bulk_create_jobs_use_case()
+        views.GetUpdateDeleteJobView.get_job_use_case = container.get_job_use_case()
+        views.GetUpdateDeleteJobView.update_job_use_case = container.update_job_use_case()
+        views.GetUpdateDeleteJobView.delete_job_use_case = container.delete_job_use_case()
+        views.ListJobsView.list_jobs_use_case = container.list_jobs_use_case()
+        views.CancelJobView.cancel_job_use_case = container.cancel_job_use_case()
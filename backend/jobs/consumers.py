@@ -1,10 +1,28 @@
-import json
+import asyncio
+import orjson
 from channels.generic.websocket import AsyncWebsocketConsumer
 
+# Coalesce log events for a short window before sending, so a chatty job
+# costs one WebSocket frame per flush instead of one per line
+FLUSH_INTERVAL_SECONDS = 0.02
+FLUSH_MAX_BATCH = 256
+
+
+class _TerminalStatus:
+    """Queue sentinel carrying a job's terminal status"""
+
+    __slots__ = ('status',)
+
+    def __init__(self, status):
+        self.status = status
+
+
 class JobLogConsumer(AsyncWebsocketConsumer):
     async def connect(self):
         self.job_id = self.scope['url_route']['kwargs']['job_id']
         self.group_name = f'job_logs_{self.job_id}'
+        self.log_queue = asyncio.Queue()
+        self.flusher_task = asyncio.create_task(self._flusher())
 
         # Join group
         await self.channel_layer.group_add(
@@ -14,14 +32,60 @@ class JobLogConsumer(AsyncWebsocketConsumer):
         await self.accept()
 
     async def disconnect(self, close_code):
+        self.flusher_task.cancel()
+        try:
+            await self.flusher_task
+        except asyncio.CancelledError:
+            pass
+
         # Leave group
         await self.channel_layer.group_discard(
             self.group_name,
             self.channel_name
         )
 
-    # Receive message from group
+    # Receive message from group — just enqueue, the flusher batches sends
     async def send_log(self, event):
-        await self.send(text_data=json.dumps({
-            'log': event['log']
-        }))
+        self.log_queue.put_nowait(event['log'])
+
+    # Terminal status from the worker goes through the same queue as the
+    # logs: the flusher may already be holding popped log lines during its
+    # coalescing sleep, and sending the status directly here would let it
+    # overtake them — clients stop reading at the status frame, so the
+    # job's last lines would be lost
+    async def send_status(self, event):
+        self.log_queue.put_nowait(_TerminalStatus(event['status']))
+
+    def _drain_queue(self, items):
+        while len(items) < FLUSH_MAX_BATCH:
+            try:
+                items.append(self.log_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return items
+
+    async def _flusher(self):
+        while True:
+            # Block for the first item, wait briefly for stragglers, then
+            # send everything queued — logs coalesced into single frames,
+            # in arrival order relative to any terminal status
+            items = [await self.log_queue.get()]
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+            self._drain_queue(items)
+            logs = []
+            for item in items:
+                if isinstance(item, _TerminalStatus):
+                    if logs:
+                        await self.send(text_data=orjson.dumps({
+                            'log': ''.join(logs)
+                        }).decode())
+                        logs = []
+                    await self.send(text_data=orjson.dumps({
+                        'status': item.status
+                    }).decode())
+                else:
+                    logs.append(item)
+            if logs:
+                await self.send(text_data=orjson.dumps({
+                    'log': ''.join(logs)
+                }).decode())
@@ -1,5 +1,5 @@
 import abc
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from jobs.domain.domain_models import JobDomainModel, JobCreateRequest, JobUpdateRequest
@@ -11,17 +11,40 @@ class JobAbstractRepository(abc.ABC):
         """Create a new job"""
 
     @abc.abstractmethod
-    def get(self, job_id: UUID) -> JobDomainModel:
-        """Get a job by id"""
+    def bulk_create(self, job_domains: List[JobDomainModel]) -> List[JobDomainModel]:
+        """Create several jobs in a single INSERT"""
+
+    @abc.abstractmethod
+    def get(self, job_id: UUID, fields: Optional[Tuple[str, ...]] = None) -> JobDomainModel:
+        """Get a job by id, optionally fetching only the given columns"""
 
     @abc.abstractmethod
     def list(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[JobDomainModel]:
         """List all jobs with optional pagination"""
 
+    @abc.abstractmethod
+    def list_with_total(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor_created_at=None,
+        cursor_id: Optional[UUID] = None,
+        ids: Optional[List[UUID]] = None,
+    ) -> Tuple[List[JobDomainModel], int]:
+        """List jobs and the total count in a single query"""
+
     @abc.abstractmethod
     def update(self, job_domain: JobDomainModel, update_fields: List[str]) -> JobDomainModel:
         """Update a job with specific fields"""
 
+    @abc.abstractmethod
+    def patch(self, job_id: UUID, changes: dict) -> int:
+        """Apply a partial update in a single UPDATE, returning affected row count"""
+
+    @abc.abstractmethod
+    def cancel(self, job_id: UUID) -> int:
+        """Cancel a job if it is not terminal, returning affected row count"""
+
     @abc.abstractmethod
     def delete(self, job_id: UUID) -> None:
         """Delete a job"""
@@ -1,44 +1,164 @@
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
-from django.db import IntegrityError
+import orjson
+from django.db import IntegrityError, connection
+from django.db.models import Count, Q, Window
 from django.utils import timezone
 
 from jobs.data.abstract_repo import JobAbstractRepository
 from jobs.domain.domain_models import JobDomainModel
 from jobs.exceptions import JobAlreadyExistsException, JobDoesNotExistException
-from jobs.models import Job
+from jobs.models import Job, JobStatusChoice
 
 logger = logging.getLogger(__name__)
 
+# Column tuple for .values() queries — fetching plain dicts skips Django's
+# per-row Model.__init__ on the list paths
+_JOB_COLUMNS = (
+    "id",
+    "command",
+    "timeout",
+    "priority",
+    "status",
+    "parameters",
+    "stdout",
+    "stderr",
+    "created_at",
+    "modified_at",
+    "started_at",
+    "completed_at",
+    "task_id",
+    "remote_process_id",
+)
+
+# List endpoints don't render output, so the potentially multi-MB
+# stdout/stderr TEXT columns stay in the database; the detail endpoint
+# fetches them on demand
+_LIST_COLUMNS = tuple(c for c in _JOB_COLUMNS if c not in ("stdout", "stderr"))
+
+# Parameterized INSERT built once at import; executing it directly skips
+# Model.__init__, field descriptors and save() signal dispatch per insert
+_INSERT_JOB_SQL = (
+    "INSERT INTO jobs"
+    " (id, command, timeout, priority, status, parameters, created_at, modified_at)"
+    " VALUES (%s, %s, %s, %s, %s, %s::jsonb, %s, %s)"
+    f" RETURNING {', '.join(_JOB_COLUMNS)}"
+)
+
+# Statuses a job can never leave — hoisted so cancel() doesn't rebuild
+# the list per call
+_TERMINAL_STATUSES = (
+    JobStatusChoice.SUCCESS,
+    JobStatusChoice.FAILED,
+    JobStatusChoice.CANCELLED,
+)
+
+# Fields callers may update — frozenset gives O(1) membership with no
+# per-call list allocation
+_UPDATABLE_FIELDS = frozenset(
+    (
+        "command",
+        "timeout",
+        "priority",
+        "status",
+        "parameters",
+        "stdout",
+        "stderr",
+        "started_at",
+        "completed_at",
+        "task_id",
+        "remote_process_id",
+    )
+)
+
 
 class JobDbRepository(JobAbstractRepository):
     def create(self, job_domain: JobDomainModel) -> JobDomainModel:
-        """Create a new job (ATOMIC_REQUESTS handles transaction)"""
+        """Create a new job (ATOMIC_REQUESTS handles transaction)
+
+        Runs a raw INSERT ... RETURNING rather than Model.objects.create;
+        the hot create path skips the ORM's per-write Python machinery and
+        hydrates the domain model straight from the returned row.
+        """
         logger.info(
             "Creating a new job with command: %s",
             job_domain.command,
         )
+        # One timestamp per call: cheaper, and created_at == modified_at
+        # on freshly created rows
+        now = timezone.now()
+        parameters = (
+            orjson.dumps(job_domain.parameters).decode()
+            if job_domain.parameters is not None
+            else None
+        )
         try:
-            job_db_entry = Job.objects.create(
-                id=job_domain.id,
-                command=job_domain.command,
-                timeout=job_domain.timeout,
-                priority=job_domain.priority.value,
-                parameters=job_domain.parameters,
-                status=job_domain.status.value,
-                created_at=timezone.now(),
-                modified_at=timezone.now(),
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    _INSERT_JOB_SQL,
+                    (
+                        job_domain.id,
+                        job_domain.command,
+                        job_domain.timeout,
+                        job_domain.priority.value,
+                        job_domain.status.value,
+                        parameters,
+                        now,
+                        now,
+                    ),
+                )
+                row = cursor.fetchone()
+            data = dict(zip(_JOB_COLUMNS, row))
+            # Django registers jsonb to come back raw from the cursor
+            if isinstance(data["parameters"], str):
+                data["parameters"] = orjson.loads(data["parameters"])
+            return JobDomainModel(**data)
+        except IntegrityError as exc:
+            raise JobAlreadyExistsException from exc
+
+    def bulk_create(self, job_domains: List[JobDomainModel]) -> List[JobDomainModel]:
+        """Create several jobs with one multi-row INSERT
+
+        bulk_create sends a single statement for the whole batch, so N
+        submissions cost one roundtrip instead of N.
+        """
+        logger.info("Bulk creating %d jobs", len(job_domains))
+        now = timezone.now()
+        try:
+            created = Job.objects.bulk_create(
+                [
+                    Job(
+                        id=job.id,
+                        command=job.command,
+                        timeout=job.timeout,
+                        priority=job.priority.value,
+                        status=job.status.value,
+                        parameters=job.parameters,
+                        created_at=now,
+                        modified_at=now,
+                    )
+                    for job in job_domains
+                ]
             )
-            return JobDomainModel.from_orm(job_db_entry)
         except IntegrityError as exc:
             raise JobAlreadyExistsException from exc
+        return [JobDomainModel.model_validate(entry) for entry in created]
 
-    def get(self, job_id: UUID) -> JobDomainModel:
-        """Get a job by id"""
+    def get(self, job_id: UUID, fields: Optional[Tuple[str, ...]] = None) -> JobDomainModel:
+        """Get a job by id
+
+        Pass fields to fetch only those columns — wide rows carry
+        potentially large stdout/stderr blobs most callers don't need.
+        The partial model is built without validation and only carries
+        the requested fields.
+        """
         try:
+            if fields:
+                row = Job.objects.values(*fields).get(id=job_id)
+                return JobDomainModel.model_construct(**row)
             job_db_entry = Job.objects.get(id=job_id)
-            return JobDomainModel.from_orm(job_db_entry)
+            return JobDomainModel.model_validate(job_db_entry)
         except Job.DoesNotExist as exc:
             raise JobDoesNotExistException from exc
 
@@ -50,8 +170,59 @@ class JobDbRepository(JobAbstractRepository):
             queryset = queryset[offset:]
         if limit:
             queryset = queryset[:limit]
-            
-        return [JobDomainModel.from_orm(job) for job in queryset]
+
+        return [JobDomainModel(**row) for row in queryset.values(*_LIST_COLUMNS)]
+
+    def list_with_total(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor_created_at=None,
+        cursor_id: Optional[UUID] = None,
+        ids: Optional[List[UUID]] = None,
+    ) -> Tuple[List[JobDomainModel], int]:
+        """List jobs and the total count in a single query
+
+        COUNT(*) OVER() is evaluated before LIMIT/OFFSET, so every returned
+        row carries the matching-row count and the separate count()
+        roundtrip is skipped.
+
+        When a keyset cursor is given, the page starts strictly after
+        (cursor_created_at, cursor_id) in descending order — an indexed
+        seek that stays O(log n) at any page depth, unlike OFFSET which
+        re-scans every skipped row.
+        """
+        filters = Q()
+        if ids:
+            filters &= Q(id__in=ids)
+        if cursor_created_at is not None:
+            filters &= (
+                Q(created_at__lt=cursor_created_at)
+                | Q(created_at=cursor_created_at, id__lt=cursor_id)
+            )
+
+        queryset = (
+            Job.objects.annotate(_total=Window(expression=Count("id")))
+            .filter(filters)
+            .order_by('-created_at', '-id')
+        )
+
+        if offset and cursor_created_at is None:
+            queryset = queryset[offset:]
+        if limit:
+            queryset = queryset[:limit]
+
+        rows = list(queryset.values(*_LIST_COLUMNS, "_total"))
+        if rows:
+            total = rows[0]["_total"]
+        else:
+            # An out-of-range page returns no rows; count under the same
+            # filters so the total agrees with the pages that had rows
+            # (a cursor walk's last page must not report the full table)
+            total = Job.objects.filter(filters).count()
+        for row in rows:
+            del row["_total"]
+        return [JobDomainModel(**row) for row in rows], total
 
     def update(self, job_domain: JobDomainModel, update_fields: List[str]) -> JobDomainModel:
         """Update a job with specific fields and race condition protection"""
@@ -61,48 +232,68 @@ class JobDbRepository(JobAbstractRepository):
             update_fields,
         )
         try:
-            job_db_entry = Job.objects.select_for_update().get(id=job_domain.id)
-            
+            now = timezone.now()
+            job_db_entry = Job.objects.get(id=job_domain.id)
+
+            # Per-field logging is guarded so the hot loop skips the log
+            # record entirely when INFO is disabled
+            log_fields = logger.isEnabledFor(logging.INFO)
+            applied_fields = []
             for field in update_fields:
-                if field in [
-                    "command",
-                    "timeout",
-                    "priority", 
-                    "status",
-                    "parameters",
-                    "stdout",
-                    "stderr",
-                    "started_at",
-                    "completed_at",
-                    "task_id",
-                    "remote_process_id",
-                ]:
-                    logger.info(
-                        "Updating field %s of job %s",
-                        field,
-                        job_domain.id,
-                    )
-                    field_value = getattr(job_domain, field)
-                    if field == 'status' and field_value:
-                        setattr(job_db_entry, field, field_value.value if hasattr(field_value, 'value') else field_value)
-                    else:
-                        setattr(job_db_entry, field, field_value)
-            
-            job_db_entry.modified_at = timezone.now()
-            job_db_entry.save()
-            
-            return JobDomainModel.from_orm(job_db_entry)
+                if field in _UPDATABLE_FIELDS:
+                    if log_fields:
+                        logger.info(
+                            "Updating field %s of job %s",
+                            field,
+                            job_domain.id,
+                        )
+                    # Domain enums subclass str, so values can be assigned
+                    # directly without probing for .value
+                    setattr(job_db_entry, field, getattr(job_domain, field))
+                    applied_fields.append(field)
+
+            job_db_entry.modified_at = now
+            # Narrow UPDATE: only changed columns are written, so unchanged
+            # (potentially large) columns and their indexes are untouched
+            job_db_entry.save(update_fields=applied_fields + ['modified_at'])
+
+            return JobDomainModel.model_validate(job_db_entry)
         except Job.DoesNotExist as exc:
             raise JobDoesNotExistException from exc
 
+    def patch(self, job_id: UUID, changes: dict) -> int:
+        """Apply a partial update in a single UPDATE, returning affected row count
+
+        Pushes the patch server-side instead of get + mutate + save, so
+        there is no read roundtrip and no SELECT FOR UPDATE footprint.
+        """
+        logger.info("Patching job %s with fields %s", job_id, list(changes))
+        allowed = {
+            field: value
+            for field, value in changes.items()
+            if field in _UPDATABLE_FIELDS
+        }
+        if not allowed:
+            return 0
+        return Job.objects.filter(id=job_id).update(
+            **allowed, modified_at=timezone.now()
+        )
+
+    def cancel(self, job_id: UUID) -> int:
+        """Cancel a job with a single conditional UPDATE, returning affected row count"""
+        logger.info("Cancelling job %s", job_id)
+        return (
+            Job.objects.filter(id=job_id)
+            .exclude(status__in=_TERMINAL_STATUSES)
+            .update(status=JobStatusChoice.CANCELLED, modified_at=timezone.now())
+        )
+
     def delete(self, job_id: UUID) -> None:
-        """Delete a job"""
+        """Delete a job in a single DELETE, no prior SELECT FOR UPDATE"""
         logger.info("Deleting job %s", job_id)
-        try:
-            job_db_entry = Job.objects.select_for_update().get(id=job_id)
-            job_db_entry.delete()
-        except Job.DoesNotExist as exc:
-            raise JobDoesNotExistException from exc
+        deleted, _ = Job.objects.filter(id=job_id).delete()
+        if not deleted:
+            raise JobDoesNotExistException
 
     def count(self) -> int:
         """Get total count of jobs"""
@@ -112,6 +303,6 @@ class JobDbRepository(JobAbstractRepository):
         """Get a job with database lock for safe updates"""
         try:
             job_db_entry = Job.objects.select_for_update().get(id=job_id)
-            return JobDomainModel.from_orm(job_db_entry)
+            return JobDomainModel.model_validate(job_db_entry)
         except Job.DoesNotExist as exc:
             raise JobDoesNotExistException from exc
@@ -1,7 +1,8 @@
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ConfigDict, RootModel
 from enum import Enum
 
 
@@ -20,6 +21,8 @@ class JobPriorityEnum(str, Enum):
 
 
 class JobDomainModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: Optional[UUID] = None
     command: str
     timeout: int = 60
@@ -35,9 +38,6 @@ class JobDomainModel(BaseModel):
     task_id: Optional[str] = None
     remote_process_id: Optional[str] = None
 
-    class Config:
-        orm_mode = True
-
 
 class JobCreateRequest(BaseModel):
     command: str
@@ -47,6 +47,10 @@ class JobCreateRequest(BaseModel):
     streaming: Optional[bool] = False
 
 
+class JobBulkCreateRequest(BaseModel):
+    jobs: List[JobCreateRequest]
+
+
 class JobUpdateRequest(BaseModel):
     command: Optional[str] = None
     timeout: Optional[int] = None
@@ -65,16 +69,28 @@ class JobUpdateRequest(BaseModel):
         return hasattr(self, field_name) and getattr(self, field_name) is not None
 
 
-class JobListDomainModel(BaseModel):
+class JobListDomainModel(RootModel[List[JobDomainModel]]):
     """Domain model for job list operations"""
-    __root__: List[JobDomainModel]
 
     def dict_serialized(self) -> dict:
         """Serialize to dict for JSON response"""
-        return {"jobs": [job.dict() for job in self.__root__]}
+        return {"jobs": [job.model_dump() for job in self.root]}
+
+    def dict_serialized_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes, skipping the intermediate
+        model_dump copy per job; default=str covers UUIDs/datetimes/enums"""
+        return orjson.dumps(
+            {"jobs": [job.__dict__ for job in self.root]}, default=str
+        )
 
 
 class JobListRequest(BaseModel):
-    """Request model for listing jobs with pagination"""
+    """Request model for listing jobs with pagination
+
+    Keyset pagination (cursor_created_at + cursor_id of the last row seen)
+    is preferred over offset on large tables.
+    """
     limit: Optional[int] = None
     offset: Optional[int] = None
+    cursor_created_at: Optional[datetime] = None
+    cursor_id: Optional[UUID] = None
@@ -0,0 +1,41 @@
+import logging
+import uuid
+from typing import List
+
+from jobs.data.abstract_repo import JobAbstractRepository
+from jobs.domain.domain_models import JobDomainModel, JobBulkCreateRequest
+from jobs.tasks import run_job, run_job_streaming
+
+logger = logging.getLogger(__name__)
+
+
+class BulkCreateJobsUseCase:
+    def __init__(
+        self,
+        db_repo: JobAbstractRepository,
+    ) -> None:
+        self.db_repo = db_repo
+
+    def execute(self, bulk_request: JobBulkCreateRequest) -> List[JobDomainModel]:
+        logger.info("Got request to create %d jobs", len(bulk_request.jobs))
+        job_domains = [
+            JobDomainModel(
+                id=uuid.uuid4(),
+                command=create_request.command,
+                timeout=create_request.timeout,
+                priority=create_request.priority,
+                parameters=create_request.parameters,
+            )
+            for create_request in bulk_request.jobs
+        ]
+        created_jobs = self.db_repo.bulk_create(job_domains)
+        for create_request, created_job in zip(bulk_request.jobs, created_jobs):
+            try:
+                if create_request.streaming:
+                    run_job_streaming.delay(str(created_job.id))
+                else:
+                    run_job.delay(str(created_job.id))
+            except Exception as e:
+                logger.error("Failed to queue job %s: %s", created_job.id, e)
+        logger.info("Queued %d jobs for execution", len(created_jobs))
+        return created_jobs
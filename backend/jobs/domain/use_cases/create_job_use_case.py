@@ -1,9 +1,9 @@
 import logging
 import uuid
-from dependency_injector.wiring import Provide
 
 from jobs.data.abstract_repo import JobAbstractRepository
 from jobs.domain.domain_models import JobDomainModel, JobCreateRequest
+from jobs.tasks import run_job, run_job_streaming
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 class CreateJobUseCase:
     def __init__(
         self,
-        db_repo: JobAbstractRepository = Provide["db_repo"],
+        db_repo: JobAbstractRepository,
     ) -> None:
         self.db_repo = db_repo
 
@@ -27,13 +27,11 @@ class CreateJobUseCase:
         created_job = self.db_repo.create(job_domain)
         try:
             if create_request.streaming:
-                from jobs.tasks import run_job_streaming
                 run_job_streaming.delay(str(created_job.id))
-                logger.info(f"Job {created_job.id} queued for streaming execution")
+                logger.info("Job %s queued for streaming execution", created_job.id)
             else:
-                from jobs.tasks import run_job
                 run_job.delay(str(created_job.id))
-                logger.info(f"Job {created_job.id} queued for execution")
+                logger.info("Job %s queued for execution", created_job.id)
         except Exception as e:
-            logger.error(f"Failed to queue job {created_job.id}: {e}")
+            logger.error("Failed to queue job %s: %s", created_job.id, e)
         return created_job
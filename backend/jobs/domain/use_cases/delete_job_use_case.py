@@ -1,6 +1,5 @@
 import logging
 from uuid import UUID
-from dependency_injector.wiring import Provide
 
 from jobs.data.abstract_repo import JobAbstractRepository
 
@@ -10,7 +9,7 @@ logger = logging.getLogger(__name__)
 class DeleteJobUseCase:
     def __init__(
         self,
-        db_repo: JobAbstractRepository = Provide["db_repo"],
+        db_repo: JobAbstractRepository,
     ) -> None:
         self.db_repo = db_repo
 
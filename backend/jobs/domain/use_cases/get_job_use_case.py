@@ -1,6 +1,5 @@
 import logging
 from uuid import UUID
-from dependency_injector.wiring import Provide
 
 from jobs.data.abstract_repo import JobAbstractRepository
 from jobs.domain.domain_models import JobDomainModel
@@ -11,7 +10,7 @@ logger = logging.getLogger(__name__)
 class GetJobUseCase:
     def __init__(
         self,
-        db_repo: JobAbstractRepository = Provide["db_repo"],
+        db_repo: JobAbstractRepository,
     ) -> None:
         self.db_repo = db_repo
 
@@ -1,5 +1,4 @@
 import logging
-from dependency_injector.wiring import Provide
 
 from jobs.infrastructure.remote_command_executor import RemoteCommandExecutorInterface
 
@@ -9,15 +8,15 @@ logger = logging.getLogger(__name__)
 class KillRemoteProcessUseCase:
     def __init__(
         self,
-        remote_executor: RemoteCommandExecutorInterface = Provide["remote_executor"],
+        remote_executor: RemoteCommandExecutorInterface,
     ) -> None:
         self.remote_executor = remote_executor
 
     def execute(self, pid: str) -> None:
-        logger.info(f"Killing remote process with PID: {pid}")
+        logger.info("Killing remote process with PID: %s", pid)
         try:
             self.remote_executor.kill_process(pid)
-            logger.info(f"Process {pid} killed successfully")
+            logger.info("Process %s killed successfully", pid)
         except Exception as e:
-            logger.error(f"Failed to kill remote process {pid}: {e}")
+            logger.error("Failed to kill remote process %s: %s", pid, e)
             raise
@@ -1,6 +1,7 @@
 import logging
+from datetime import datetime
 from typing import List, Optional
-from dependency_injector.wiring import Provide
+from uuid import UUID
 
 from jobs.data.abstract_repo import JobAbstractRepository
 from jobs.domain.domain_models import JobDomainModel
@@ -9,6 +10,8 @@ logger = logging.getLogger(__name__)
 
 
 class JobListResponse:
+    __slots__ = ("jobs", "total_count")
+
     def __init__(self, jobs: List[JobDomainModel], total_count: int):
         self.jobs = jobs
         self.total_count = total_count
@@ -17,14 +20,26 @@ class JobListResponse:
 class ListJobsUseCase:
     def __init__(
         self,
-        db_repo: JobAbstractRepository = Provide["db_repo"],
+        db_repo: JobAbstractRepository,
     ) -> None:
         self.db_repo = db_repo
 
-    def execute(self, limit: Optional[int] = None, offset: Optional[int] = None) -> JobListResponse:
+    def execute(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor_created_at: Optional[datetime] = None,
+        cursor_id: Optional[UUID] = None,
+        ids: Optional[List[UUID]] = None,
+    ) -> JobListResponse:
         logger.info("Got request to list jobs with limit %s and offset %s", limit, offset)
-        jobs = self.db_repo.list(limit=limit, offset=offset)
-        total_count = self.db_repo.count()
+        jobs, total_count = self.db_repo.list_with_total(
+            limit=limit,
+            offset=offset,
+            cursor_created_at=cursor_created_at,
+            cursor_id=cursor_id,
+            ids=list(ids) if ids else None,
+        )
         return JobListResponse(
             jobs=jobs,
             total_count=total_count
@@ -1,8 +1,63 @@
 import asyncio
+import logging
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from channels.layers import get_channel_layer
 
-from jobs.infrastructure.ssh_client import SSHClientInterface
+from jobs.infrastructure.ssh_client import SSHClient, SSHClientInterface
+
+logger = logging.getLogger(__name__)
+
+# Streaming flush tuning: drain whatever the channel has buffered and send
+# it as one frame, flushing early once this many bytes are pending so a
+# firehose command can't grow an unbounded payload
+RECV_CHUNK_BYTES = 65536
+FLUSH_MAX_BYTES = 16384
+
+# Only the trailing MAX_CAPTURE_BYTES of each stream is kept in memory and
+# persisted — a runaway command must not OOM the worker or force a
+# multi-MB UPDATE. Subscribers still receive the full stream live.
+MAX_CAPTURE_BYTES = int(os.environ.get("MAX_CAPTURE_BYTES", 1024 * 1024))
+
+# Window during which concurrent kill_process calls are merged into one
+# `kill -9 PID1 PID2 ...` exec over a single pooled connection
+KILL_BATCH_WINDOW_SECONDS = 0.05
+
+
+class _KillBatch:
+    """Kill requests collected during one batching window"""
+
+    def __init__(self):
+        self.pids = []
+        self.done = threading.Event()
+        self.error = None
+
+
+class _BoundedCapture:
+    """Ring buffer of byte chunks keeping the trailing max_bytes"""
+
+    def __init__(self, max_bytes: int = MAX_CAPTURE_BYTES):
+        self._chunks = deque()
+        self._size = 0
+        self._max_bytes = max_bytes
+        self.truncated_bytes = 0
+
+    def append(self, chunk: bytes):
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        while self._size > self._max_bytes and len(self._chunks) > 1:
+            dropped = self._chunks.popleft()
+            self._size -= len(dropped)
+            self.truncated_bytes += len(dropped)
+
+    def text(self) -> str:
+        joined = b"".join(self._chunks).decode("utf-8", errors="replace")
+        if self.truncated_bytes:
+            return f"[... {self.truncated_bytes} bytes truncated ...]\n{joined}"
+        return joined
 
 
 class RemoteCommandExecutorInterface(ABC):
@@ -21,8 +76,52 @@ class RemoteCommandExecutorInterface(ABC):
 
 class RemoteCommandExecutor(RemoteCommandExecutorInterface):
     def __init__(self, ssh_client: SSHClientInterface = None):
-        from jobs.infrastructure.ssh_client import SSHClient
         self.ssh_client = ssh_client or SSHClient()
+        # (queue, drainer task) per event loop — concurrent streaming jobs
+        # on the same loop share one dispatcher
+        self._dispatchers = {}
+        self._kill_lock = threading.Lock()
+        self._kill_batch = None
+
+    def _get_dispatch_queue(self, loop):
+        entry = self._dispatchers.get(loop)
+        if entry is None or entry[1].done():
+            queue = asyncio.Queue()
+            task = loop.create_task(self._dispatch_logs(queue))
+            entry = (queue, task)
+            self._dispatchers[loop] = entry
+        return entry[0]
+
+    async def _dispatch_logs(self, queue):
+        """Drain queued (group, message) pairs and send each batch with one
+        gather, so concurrent streaming jobs issue their Redis commands
+        together instead of awaiting group_send one at a time.
+
+        Failed sends are logged and dropped — the dispatcher must outlive
+        any one batch, because running jobs hold a reference to this queue
+        and block on join() when they finish; a dead dispatcher would hang
+        them forever. Live log frames are best-effort anyway (the full
+        output is persisted on the Job row).
+        """
+        channel_layer = get_channel_layer()
+        while True:
+            batch = [await queue.get()]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                results = await asyncio.gather(
+                    *[channel_layer.group_send(group, message) for group, message in batch],
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        logger.warning("Dropping log frame, group_send failed: %s", result)
+            finally:
+                for _ in batch:
+                    queue.task_done()
 
     def execute_command_sync(self, command: str, timeout: int = 60):
         ssh = self.ssh_client.get_connection()
@@ -36,64 +135,134 @@ class RemoteCommandExecutor(RemoteCommandExecutorInterface):
 
     async def execute_command_streaming(self, job_id: str, command: str, timeout: int = 60):
         ssh = self.ssh_client.get_connection()
-        
+
         try:
-            channel = ssh.get_transport().open_session()
+            channel = self.ssh_client.get_session(ssh)
             channel.exec_command(command)
+            channel.setblocking(False)
 
-            channel_layer = get_channel_layer()
+            # Accumulate raw bytes and join once at the end — str += copies
+            # the whole buffer on every chunk, which is O(n²) over the run
+            stdout_parts = _BoundedCapture()
+            stderr_parts = _BoundedCapture()
 
-            stdout_buffer = ""
-            stderr_buffer = ""
-            
-            start_time = asyncio.get_event_loop().time()
+            # Event-driven readiness: the channel's socket fd is registered
+            # on the loop, so the task wakes when data actually arrives
+            # instead of polling every 100 ms
+            loop = asyncio.get_event_loop()
+            log_queue = self._get_dispatch_queue(loop)
+            readable = asyncio.Event()
+            fd = channel.fileno()
+            loop.add_reader(fd, readable.set)
 
-            while True:
-                # Check for timeout
-                current_time = asyncio.get_event_loop().time()
-                if current_time - start_time > timeout:
-                    # Send timeout message to WebSocket
-                    await channel_layer.group_send(
-                        f"job_logs_{job_id}",
-                        {
-                            "type": "send_log",
-                            "log": f"\n⏰ Command timed out after {timeout} seconds\n",
-                        },
-                    )
-                    channel.close()
-                    raise TimeoutError(f"Command timed out after {timeout} seconds")
-                    
-                if channel.recv_ready():
-                    data = channel.recv(1024).decode()
-                    stdout_buffer += data
-                    await channel_layer.group_send(
-                        f"job_logs_{job_id}",
-                        {
-                            "type": "send_log",
-                            "log": data,
-                        },
-                    )
-                if channel.recv_stderr_ready():
-                    data = channel.recv_stderr(1024).decode()
-                    stderr_buffer += data
-                    await channel_layer.group_send(
-                        f"job_logs_{job_id}",
-                        {
-                            "type": "send_log",
-                            "log": data,
-                        },
-                    )
-                if channel.exit_status_ready():
-                    break
-                await asyncio.sleep(0.1)
+            deadline = loop.time() + timeout
+
+            try:
+                while True:
+                    # Drain everything currently buffered before sending, so
+                    # a burst of small reads becomes one frame and one Redis
+                    # round trip instead of one per 1 KiB chunk
+                    pending = 0
+                    stdout_chunks = []
+                    while channel.recv_ready() and pending < FLUSH_MAX_BYTES:
+                        chunk = channel.recv(RECV_CHUNK_BYTES)
+                        stdout_chunks.append(chunk)
+                        pending += len(chunk)
+                    stderr_chunks = []
+                    while channel.recv_stderr_ready() and pending < FLUSH_MAX_BYTES:
+                        chunk = channel.recv_stderr(RECV_CHUNK_BYTES)
+                        stderr_chunks.append(chunk)
+                        pending += len(chunk)
 
-            return stdout_buffer, stderr_buffer
+                    if stdout_chunks:
+                        raw = b"".join(stdout_chunks)
+                        stdout_parts.append(raw)
+                        log_queue.put_nowait(
+                            (
+                                f"job_logs_{job_id}",
+                                {"type": "send_log", "log": raw.decode(errors="replace")},
+                            )
+                        )
+                    if stderr_chunks:
+                        raw = b"".join(stderr_chunks)
+                        stderr_parts.append(raw)
+                        log_queue.put_nowait(
+                            (
+                                f"job_logs_{job_id}",
+                                {"type": "send_log", "log": raw.decode(errors="replace")},
+                            )
+                        )
+                    if pending >= FLUSH_MAX_BYTES:
+                        # More data is waiting — drain again, but yield first
+                        # so the shared _dispatch_logs task gets a turn; a
+                        # firehose command would otherwise starve it and pile
+                        # frames up in the unbounded queue
+                        await asyncio.sleep(0)
+                        continue
+                    if channel.exit_status_ready():
+                        break
+
+                    readable.clear()
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        # Send timeout message to WebSocket
+                        log_queue.put_nowait(
+                            (
+                                f"job_logs_{job_id}",
+                                {
+                                    "type": "send_log",
+                                    "log": f"\n⏰ Command timed out after {timeout} seconds\n",
+                                },
+                            )
+                        )
+                        channel.close()
+                        raise TimeoutError(f"Command timed out after {timeout} seconds")
+                    try:
+                        await asyncio.wait_for(readable.wait(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                loop.remove_reader(fd)
+                # Don't return (or tear down the loop) with frames still queued
+                await log_queue.join()
+
+            return stdout_parts.text(), stderr_parts.text()
         finally:
             self.ssh_client.close_connection(ssh)
 
     def kill_process(self, pid: str):
-        ssh = self.ssh_client.get_connection()
+        """Kill a remote process, coalescing concurrent requests
+
+        The first caller in a window becomes the batch leader: it waits
+        briefly for stragglers, then issues one `kill -9` for every
+        collected pid over one connection. Followers block until the
+        leader's exec finishes, so a burst cancel costs one round trip
+        instead of one per job.
+        """
+        with self._kill_lock:
+            batch = self._kill_batch
+            leader = batch is None
+            if leader:
+                batch = self._kill_batch = _KillBatch()
+            batch.pids.append(pid)
+
+        if not leader:
+            batch.done.wait()
+            if batch.error is not None:
+                raise batch.error
+            return
+
+        time.sleep(KILL_BATCH_WINDOW_SECONDS)
+        with self._kill_lock:
+            self._kill_batch = None
         try:
-            ssh.exec_command(f"kill -9 {pid}")
+            ssh = self.ssh_client.get_connection()
+            try:
+                ssh.exec_command(f"kill -9 {' '.join(batch.pids)}")
+            finally:
+                self.ssh_client.close_connection(ssh)
+        except Exception as exc:
+            batch.error = exc
+            raise
         finally:
-            self.ssh_client.close_connection(ssh)
+            batch.done.set()
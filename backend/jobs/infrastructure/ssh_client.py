@@ -1,6 +1,35 @@
+import atexit
+import logging
 import os
-import paramiko
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
+
+import paramiko
+
+logger = logging.getLogger(__name__)
+
+# Parsed private keys, keyed by path — re-parsing the PEM on every pool
+# miss is pure waste
+_KEY_CACHE = {}
+_KEY_CACHE_LOCK = threading.Lock()
+
+# Idle connections kept per (hostname, username, key_path) key
+MAX_IDLE_CONNECTIONS = 4
+
+# Pre-opened sessions kept per pooled connection — opening a session is a
+# blocking channel-open round trip, so it is paid when a connection is
+# returned to the pool rather than when the next job starts
+MAX_IDLE_SESSIONS = 2
+
+
+def _load_key(key_path):
+    with _KEY_CACHE_LOCK:
+        key = _KEY_CACHE.get(key_path)
+        if key is None:
+            key = paramiko.RSAKey.from_private_key_file(key_path)
+            _KEY_CACHE[key_path] = key
+        return key
 
 
 class SSHClientInterface(ABC):
@@ -12,20 +41,128 @@ class SSHClientInterface(ABC):
     def close_connection(self, connection):
         pass
 
+    def get_session(self, connection):
+        """Open an exec session on the connection; pooling subclasses may
+        hand out a pre-opened one instead."""
+        return connection.get_transport().open_session()
+
 # TODO: Implement a more robust SSH client to support different systems and configurations
 # Currently, this is a basic implementation for EC2 connections using Paramiko.
 class SSHClient(SSHClientInterface):
+    """Pooling SSH client
+
+    A full paramiko connect pays TCP + key exchange + auth round trips,
+    which dominates the cost of the short commands this service runs.
+    Connections are pooled per (hostname, username, key_path) and
+    validated before reuse, so the KEX/auth cost is paid once per
+    connection instead of once per command. close_connection returns the
+    connection to the pool; real teardown happens at process exit.
+    """
+
+    def __init__(self):
+        # Read once and fail fast at construction rather than on every
+        # connect; the container builds this lazily on first resolution
+        self._hostname = os.environ["EC2_HOST"]
+        self._username = os.environ["EC2_USERNAME"]
+        self._key_path = os.environ["EC2_KEY_PATH"]
+        self._pools = {}
+        self._lock = threading.Lock()
+        atexit.register(self._close_all)
+
+    def _pool_key(self):
+        return (self._hostname, self._username, self._key_path)
+
+    def _is_alive(self, connection):
+        transport = connection.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            # Probe the transport — is_active() can report True on a
+            # half-dead TCP connection
+            transport.send_ignore()
+        except Exception:
+            return False
+        return True
+
     def get_connection(self):
-        hostname = os.environ["EC2_HOST"]
-        username = os.environ["EC2_USERNAME"]
-        key_path = os.environ["EC2_KEY_PATH"]
+        hostname, username, key_path = key = self._pool_key()
+
+        while True:
+            with self._lock:
+                pool = self._pools.get(key)
+                if not pool:
+                    break
+                connection = pool.pop()
+            if self._is_alive(connection):
+                return connection
+            try:
+                connection.close()
+            except Exception:
+                pass
 
-        key = paramiko.RSAKey.from_private_key_file(key_path)
         ssh = paramiko.SSHClient()
         ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(hostname=hostname, username=username, pkey=key, timeout=10)
-
+        ssh.connect(
+            hostname=hostname,
+            username=username,
+            pkey=_load_key(key_path),
+            timeout=10,
+            banner_timeout=10,
+            auth_timeout=10,
+        )
+        # Keepalives stop idle pooled connections from being dropped by
+        # NAT/firewall state timeouts
+        ssh.get_transport().set_keepalive(30)
+        ssh._pool_key = key
         return ssh
 
+    def get_session(self, connection):
+        """Pop a pre-opened session if one is hot, else open one inline
+
+        SSH sessions are one-shot, so a popped session is never reused;
+        the pool is refilled when the connection is returned.
+        """
+        sessions = getattr(connection, "_session_pool", None)
+        while sessions:
+            session = sessions.popleft()
+            if not session.closed:
+                return session
+        return connection.get_transport().open_session()
+
+    def _fill_sessions(self, connection):
+        sessions = getattr(connection, "_session_pool", None)
+        if sessions is None:
+            sessions = connection._session_pool = deque()
+        transport = connection.get_transport()
+        while len(sessions) < MAX_IDLE_SESSIONS:
+            sessions.append(transport.open_session())
+
     def close_connection(self, connection):
-        connection.close()
+        key = getattr(connection, "_pool_key", None)
+        if key is not None and self._is_alive(connection):
+            try:
+                # Pre-warm sessions now so the next borrower's job start
+                # needs no channel-open round trip
+                self._fill_sessions(connection)
+            except Exception:
+                connection.close()
+                return
+            with self._lock:
+                pool = self._pools.setdefault(key, deque())
+                if len(pool) < MAX_IDLE_CONNECTIONS:
+                    pool.append(connection)
+                    return
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _close_all(self):
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            for connection in pool:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
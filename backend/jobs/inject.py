@@ -1,9 +1,9 @@
 from dependency_injector import containers, providers
 
-from jobs.data.abstract_repo import JobAbstractRepository
 from jobs.data.db_repo import JobDbRepository
-from jobs.infrastructure.ssh_client import SSHClientInterface, SSHClient
-from jobs.infrastructure.remote_command_executor import RemoteCommandExecutorInterface, RemoteCommandExecutor
+from jobs.infrastructure.ssh_client import SSHClient
+from jobs.infrastructure.remote_command_executor import RemoteCommandExecutor
+from jobs.domain.use_cases.bulk_create_jobs_use_case import BulkCreateJobsUseCase
 from jobs.domain.use_cases.create_job_use_case import CreateJobUseCase
 from jobs.domain.use_cases.get_job_use_case import GetJobUseCase
 from jobs.domain.use_cases.list_jobs_use_case import ListJobsUseCase
@@ -16,29 +16,31 @@ from jobs.domain.use_cases.kill_remote_process_use_case import KillRemoteProcess
 
 
 class JobContainer(containers.DeclarativeContainer):
-    # Infrastructure
-    ssh_client = providers.Dependency(
-        instance_of=SSHClientInterface,
-        default=SSHClient(),
-    )
-    remote_executor = providers.Dependency(
-        instance_of=RemoteCommandExecutorInterface,
-        default=RemoteCommandExecutor(),
-    )
+    # Infrastructure — Singletons are lazy, so nothing (and no env vars)
+    # is touched until first resolution, unlike Dependency defaults which
+    # instantiated at module import
+    ssh_client = providers.Singleton(SSHClient)
+    remote_executor = providers.Singleton(RemoteCommandExecutor, ssh_client=ssh_client)
 
     # db repository
-    db_repo = providers.Dependency(
-        instance_of=JobAbstractRepository,
-        default=JobDbRepository(),
-    )
+    db_repo = providers.Singleton(JobDbRepository)
 
-    # Use cases
-    create_job_use_case = providers.Factory(CreateJobUseCase)
-    get_job_use_case = providers.Factory(GetJobUseCase)
-    list_jobs_use_case = providers.Factory(ListJobsUseCase)
-    update_job_use_case = providers.Factory(UpdateJobUseCase)
-    cancel_job_use_case = providers.Factory(CancelJobUseCase)
-    delete_job_use_case = providers.Factory(DeleteJobUseCase)
-    execute_remote_command_use_case = providers.Factory(ExecuteRemoteCommandUseCase)
-    execute_remote_command_streaming_use_case = providers.Factory(ExecuteRemoteCommandStreamingUseCase)
-    kill_remote_process_use_case = providers.Factory(KillRemoteProcessUseCase)
+    # Use cases — stateless, so Singleton caches one instance instead of
+    # constructing a fresh object per resolution; dependencies are passed
+    # explicitly so the use-case modules don't need wiring at all
+    create_job_use_case = providers.Singleton(CreateJobUseCase, db_repo=db_repo)
+    bulk_create_jobs_use_case = providers.Singleton(BulkCreateJobsUseCase, db_repo=db_repo)
+    get_job_use_case = providers.Singleton(GetJobUseCase, db_repo=db_repo)
+    list_jobs_use_case = providers.Singleton(ListJobsUseCase, db_repo=db_repo)
+    update_job_use_case = providers.Singleton(UpdateJobUseCase, db_repo=db_repo)
+    cancel_job_use_case = providers.Singleton(CancelJobUseCase, db_repo=db_repo)
+    delete_job_use_case = providers.Singleton(DeleteJobUseCase, db_repo=db_repo)
+    execute_remote_command_use_case = providers.Singleton(
+        ExecuteRemoteCommandUseCase, remote_executor=remote_executor
+    )
+    execute_remote_command_streaming_use_case = providers.Singleton(
+        ExecuteRemoteCommandStreamingUseCase, remote_executor=remote_executor
+    )
+    kill_remote_process_use_case = providers.Singleton(
+        KillRemoteProcessUseCase, remote_executor=remote_executor
+    )
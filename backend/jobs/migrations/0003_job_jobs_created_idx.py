@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-08-29 19:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_job_remote_process_id_job_task_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-created_at', 'id'], name='jobs_created_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.23 on 2026-08-29 19:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_job_jobs_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='job',
+            name='priority',
+            field=models.CharField(choices=[('Low', 'Low'), ('Medium', 'Medium'), ('High', 'High')], default='Medium', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='job',
+            name='status',
+            field=models.CharField(choices=[('Queued', 'Queued'), ('Running', 'Running'), ('Success', 'Success'), ('Failed', 'Failed'), ('Cancelled', 'Cancelled')], default='Queued', max_length=16),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'priority', 'created_at'], name='jobs_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['task_id'], name='jobs_task_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'completed_at'], name='jobs_completed_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.23 on 2026-08-29 20:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_alter_job_priority_alter_job_status_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='job',
+            name='jobs_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-created_at', '-id'], name='jobs_created_idx'),
+        ),
+    ]
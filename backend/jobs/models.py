@@ -24,14 +24,14 @@ class Job(models.Model):
     command = models.TextField()
     timeout = models.IntegerField(default=60)  # seconds
     priority = models.CharField(
-        max_length=255,
+        max_length=8,
         choices=JobPriorityChoice.choices,
         default=JobPriorityChoice.MEDIUM,
         null=False,
         blank=False,
     )
     status = models.CharField(
-        max_length=255,
+        max_length=16,
         choices=JobStatusChoice.choices,
         default=JobStatusChoice.QUEUED,
         null=False,
@@ -50,3 +50,13 @@ class Job(models.Model):
 
     class Meta:
         db_table = "jobs"
+        indexes = [
+            # Backs the '-created_at' list ordering and keyset pagination
+            models.Index(fields=["-created_at", "-id"], name="jobs_created_idx"),
+            # Dispatcher scans: queued work by priority and age
+            models.Index(fields=["status", "priority", "created_at"], name="jobs_queue_idx"),
+            # cancel_job revokes by Celery task id
+            models.Index(fields=["task_id"], name="jobs_task_id_idx"),
+            # Retention/cleanup queries over finished jobs
+            models.Index(fields=["status", "completed_at"], name="jobs_completed_idx"),
+        ]
@@ -43,9 +43,21 @@ class JobResponse(BaseModel):
             remote_process_id=job_domain.remote_process_id,
         )
 
+    @classmethod
+    def from_orm_unchecked(cls, job_domain: JobDomainModel) -> "JobResponse":
+        """Build without validation — the domain model already validated
+        every field, so re-running 14 validators per row is pure waste on
+        list responses"""
+        return cls.model_construct(**job_domain.__dict__)
+
     def dict_serialized(self) -> dict:
         """Serialize to dict for JSON response"""
-        return self.dict()
+        return self.model_dump()
+
+    def json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes in Rust, bypassing the
+        model_dump -> DRF renderer double pass"""
+        return self.__pydantic_serializer__.to_json(self)
 
 
 class JobListResponse(BaseModel):
@@ -56,11 +68,16 @@ class JobListResponse(BaseModel):
     @classmethod
     def from_domain_list(cls, jobs: List[JobDomainModel], total_count: int) -> "JobListResponse":
         """Convert list of domain models to response"""
-        return cls(
-            jobs=[JobResponse.from_orm(job) for job in jobs],
+        return cls.model_construct(
+            jobs=[JobResponse.from_orm_unchecked(job) for job in jobs],
             total_count=total_count
         )
 
     def dict_serialized(self) -> dict:
         """Serialize to dict for JSON response"""
-        return self.dict()
+        return self.model_dump()
+
+    def json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes in Rust, bypassing the
+        model_dump -> DRF renderer double pass"""
+        return self.__pydantic_serializer__.to_json(self)
@@ -1,8 +1,9 @@
 from django.urls import path
 
 from jobs.presentation.views import (
+    BulkCreateJobsView,
     CreateJobView,
-    GetUpdateDeleteJobView, 
+    GetUpdateDeleteJobView,
     ListJobsView,
     CancelJobView,
 )
@@ -11,6 +12,7 @@ app_name = "jobs"
 
 urlpatterns = [
     path("", CreateJobView.as_view(), name="create_job"),
+    path("bulk/", BulkCreateJobsView.as_view(), name="bulk_create_jobs"),
     path("list/", ListJobsView.as_view(), name="list_jobs"),
     path("<uuid:job_id>/", GetUpdateDeleteJobView.as_view(), name="get_update_delete_job"),
     path("<uuid:job_id>/cancel/", CancelJobView.as_view(), name="cancel_job"),
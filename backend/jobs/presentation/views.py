@@ -1,113 +1,210 @@
+import time
+from datetime import datetime
 from uuid import UUID
-import pydantic
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from dependency_injector.wiring import Provide
 from pydantic import ValidationError
 
+from jobs.domain.use_cases.bulk_create_jobs_use_case import BulkCreateJobsUseCase
 from jobs.domain.use_cases.create_job_use_case import CreateJobUseCase
 from jobs.domain.use_cases.get_job_use_case import GetJobUseCase
 from jobs.domain.use_cases.list_jobs_use_case import ListJobsUseCase
 from jobs.domain.use_cases.update_job_use_case import UpdateJobUseCase
 from jobs.domain.use_cases.cancel_job_use_case import CancelJobUseCase
 from jobs.domain.use_cases.delete_job_use_case import DeleteJobUseCase
-from jobs.domain.domain_models import JobCreateRequest, JobUpdateRequest
+from jobs.domain.domain_models import (
+    JobBulkCreateRequest,
+    JobCreateRequest,
+    JobStatusEnum,
+    JobUpdateRequest,
+)
 from jobs.presentation.types import JobResponse, JobListResponse
 from jobs.types import JobId
 
 
 class CreateJobView(APIView):
-    def post(
-        self,
-        request,
-        create_job_use_case: CreateJobUseCase = Provide["create_job_use_case"]
-    ):
+    # Use cases are resolved once at wire time in apps.ready() and stored
+    # as class attributes — no per-request container lookup
+    create_job_use_case: CreateJobUseCase = None
+
+    def post(self, request):
         """Create a new job"""
         try:
-            # Apply proper request validation with pydantic parse_obj_as
-            create_request = pydantic.parse_obj_as(JobCreateRequest, request.data)
+            # Apply proper request validation with pydantic model_validate
+            create_request = JobCreateRequest.model_validate(request.data)
         except ValidationError as e:
             return Response(
                 {"error": "Validation failed", "details": e.errors()},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        job = create_job_use_case.execute(create_request)
+        job = self.create_job_use_case.execute(create_request)
         response = JobResponse.from_orm(job)
-        return Response(response.dict_serialized(), status=status.HTTP_201_CREATED)
+        # Serialize once with orjson-backed pydantic and skip the DRF renderer
+        return HttpResponse(
+            response.json_bytes(),
+            content_type="application/json",
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class BulkCreateJobsView(APIView):
+    bulk_create_jobs_use_case: BulkCreateJobsUseCase = None
+
+    def post(self, request):
+        """Create several jobs in one request"""
+        try:
+            bulk_request = JobBulkCreateRequest.model_validate(request.data)
+        except ValidationError as e:
+            return Response(
+                {"error": "Validation failed", "details": e.errors()},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        jobs = self.bulk_create_jobs_use_case.execute(bulk_request)
+        response = JobListResponse.from_domain_list(jobs, len(jobs))
+        return HttpResponse(
+            response.json_bytes(),
+            content_type="application/json",
+            status=status.HTTP_201_CREATED,
+        )
+
+
+# Long-poll bounds for GET /jobs/{id}/?wait=N: one held request replaces
+# dozens of client polls, but the server re-checks no longer than this
+WAIT_MAX_SECONDS = 30
+WAIT_POLL_INTERVAL = 0.5
 
+_TERMINAL_STATUSES = (
+    JobStatusEnum.SUCCESS,
+    JobStatusEnum.FAILED,
+    JobStatusEnum.CANCELLED,
+)
 
+
+# Opted out of ATOMIC_REQUESTS: the ?wait=N long-poll would otherwise
+# hold a transaction (and its connection) idle across up to 30s of
+# sleeping. Writes re-wrap themselves in transaction.atomic below
+@method_decorator(transaction.non_atomic_requests, name='dispatch')
 class GetUpdateDeleteJobView(APIView):
-    def get(
-        self,
-        request,
-        job_id: JobId,
-        get_job_use_case: GetJobUseCase = Provide["get_job_use_case"],
-    ):
-        """Get a specific job by ID"""
-        job = get_job_use_case.execute(job_id)
+    get_job_use_case: GetJobUseCase = None
+    update_job_use_case: UpdateJobUseCase = None
+    delete_job_use_case: DeleteJobUseCase = None
+
+    def get(self, request, job_id: JobId):
+        """Get a specific job by ID, optionally long-polling via ?wait=N
+
+        With wait, the response is held until the job reaches a terminal
+        status or N seconds (capped) elapse, so a waiting client issues
+        one request per ~30s instead of one per poll interval. The view
+        is non-atomic, so each re-check runs in autocommit — it sees
+        fresh commits and no transaction is held open while sleeping.
+        """
+        wait_param = request.query_params.get('wait')
+        if wait_param is not None:
+            try:
+                wait = min(int(wait_param), WAIT_MAX_SECONDS)
+            except ValueError:
+                return Response(
+                    {"error": "wait must be an integer number of seconds"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            deadline = time.monotonic() + wait
+            while True:
+                job = self.get_job_use_case.execute(job_id)
+                remaining = deadline - time.monotonic()
+                if job.status in _TERMINAL_STATUSES or remaining <= 0:
+                    break
+                time.sleep(min(WAIT_POLL_INTERVAL, remaining))
+        else:
+            job = self.get_job_use_case.execute(job_id)
         response = JobResponse.from_orm(job)
-        return Response(data=response.dict_serialized(), status=status.HTTP_200_OK)
-
-    def patch(
-        self,
-        request,
-        job_id: JobId,
-        update_job_use_case: UpdateJobUseCase = Provide["update_job_use_case"],
-    ):
+        return HttpResponse(response.json_bytes(), content_type="application/json")
+
+    def patch(self, request, job_id: JobId):
         """Update a job"""
         try:
-            update_request = JobUpdateRequest.parse_obj(request.data)
+            update_request = JobUpdateRequest.model_validate(request.data)
         except ValidationError as e:
             return Response(
                 {"error": "Validation failed", "details": e.errors()},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        updated_job = update_job_use_case.execute(job_id, update_request)
+        with transaction.atomic():
+            updated_job = self.update_job_use_case.execute(job_id, update_request)
         response = JobResponse.from_orm(updated_job)
-        return Response(data=response.dict_serialized(), status=status.HTTP_200_OK)
-
-    def delete(
-        self,
-        request,
-        job_id: JobId,
-        delete_job_use_case: DeleteJobUseCase = Provide["delete_job_use_case"],
-    ):
+        return HttpResponse(response.json_bytes(), content_type="application/json")
+
+    def delete(self, request, job_id: JobId):
         """Delete a job"""
-        delete_job_use_case.execute(job_id)
+        with transaction.atomic():
+            self.delete_job_use_case.execute(job_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class ListJobsView(APIView):
-    def get(
-        self,
-        request,
-        list_jobs_use_case: ListJobsUseCase = Provide["list_jobs_use_case"],
-    ):
+    list_jobs_use_case: ListJobsUseCase = None
+
+    def get(self, request):
         """List all jobs with optional pagination"""
-        # Parse and validate query parameters like in CopyJournalTemplateView
-        limit = pydantic.parse_obj_as(int, request.query_params.get('limit')) if request.query_params.get('limit') else None
-        offset = pydantic.parse_obj_as(int, request.query_params.get('offset')) if request.query_params.get('offset') else None
-            
-        jobs_response = list_jobs_use_case.execute(limit=limit, offset=offset)
+        try:
+            limit = int(request.query_params['limit']) if 'limit' in request.query_params else None
+            offset = int(request.query_params['offset']) if 'offset' in request.query_params else None
+        except ValueError:
+            return Response(
+                {"error": "limit and offset must be integers"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        # Cursor params form a pair — the keyset predicate needs both
+        cursor_created_at_param = request.query_params.get('cursor_created_at')
+        cursor_id_param = request.query_params.get('cursor_id')
+        if (cursor_created_at_param is None) != (cursor_id_param is None):
+            return Response(
+                {"error": "cursor_created_at and cursor_id must be supplied together"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            cursor_created_at = datetime.fromisoformat(cursor_created_at_param) if cursor_created_at_param else None
+            cursor_id = UUID(cursor_id_param) if cursor_id_param else None
+        except ValueError:
+            return Response(
+                {"error": "cursor_created_at must be an ISO timestamp and cursor_id a UUID"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        ids_param = request.query_params.get('ids')
+        try:
+            ids = [UUID(value) for value in ids_param.split(',')] if ids_param else None
+        except ValueError:
+            return Response(
+                {"error": "ids must be a comma-separated list of UUIDs"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        jobs_response = self.list_jobs_use_case.execute(
+            limit=limit,
+            offset=offset,
+            cursor_created_at=cursor_created_at,
+            cursor_id=cursor_id,
+            ids=ids,
+        )
         # Convert domain response to presentation response
         response = JobListResponse.from_domain_list(
             jobs_response.jobs, 
             jobs_response.total_count
         )
-        return Response(data=response.dict_serialized(), status=status.HTTP_200_OK)
+        return HttpResponse(response.json_bytes(), content_type="application/json")
 
 
 class CancelJobView(APIView):
-    def post(
-        self,
-        request,
-        job_id: JobId,
-        cancel_job_use_case: CancelJobUseCase = Provide["cancel_job_use_case"],
-    ):
+    cancel_job_use_case: CancelJobUseCase = None
+
+    def post(self, request, job_id: JobId):
         """Cancel a job"""
-        cancelled_job = cancel_job_use_case.execute(job_id)
+        cancelled_job = self.cancel_job_use_case.execute(job_id)
         response = JobResponse.from_orm(cancelled_job)
-        return Response(data=response.dict_serialized(), status=status.HTTP_200_OK)
+        return HttpResponse(response.json_bytes(), content_type="application/json")
@@ -1,9 +1,6 @@
-from django.urls import re_path
+from django.urls import path
 from . import consumers
 
 websocket_urlpatterns = [
-    re_path(
-        r"ws/jobs/(?P<job_id>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})/$",
-        consumers.JobLogConsumer.as_asgi()
-    ),
+    path("ws/jobs/<uuid:job_id>/", consumers.JobLogConsumer.as_asgi()),
 ]
@@ -1,9 +1,14 @@
+import asyncio
+
+from channels.layers import get_channel_layer
+from django.db.models import Value
+from django.db.models.functions import Concat
 from django.utils import timezone
-from jobs.models import Job
+from jobs.models import Job, JobStatusChoice
 from celery import shared_task
+from celery.signals import worker_process_init
 from celery.utils.log import get_task_logger
 from dependency_injector.wiring import Provide, inject
-from asgiref.sync import async_to_sync
 
 from jobs.domain.use_cases.execute_remote_command_use_case import ExecuteRemoteCommandUseCase
 from jobs.domain.use_cases.execute_remote_command_streaming_use_case import ExecuteRemoteCommandStreamingUseCase
@@ -11,6 +16,84 @@ from jobs.domain.use_cases.kill_remote_process_use_case import KillRemoteProcess
 
 logger = get_task_logger(__name__)
 
+# The streaming task is IO-bound (SSH socket reads + Redis writes), so the
+# loop implementation matters; uvloop is a drop-in policy swap and the
+# fallback keeps environments without it working unchanged
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# One event loop per worker process, reused across task invocations —
+# async_to_sync built and tore down a loop (plus a thread hop) on every
+# streaming task
+_LOOP = None
+
+
+def _get_loop():
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP
+
+
+@worker_process_init.connect
+def _init_worker_loop(**kwargs):
+    # Fork-safety: never inherit a loop (or its fds) from the parent
+    global _LOOP
+    _LOOP = None
+    _get_loop()
+
+
+def _publish_terminal_status(job_id, status):
+    """Push a job's terminal status to its log group
+
+    WebSocket clients waiting on job_logs_{id} otherwise only ever see
+    log frames and would block until their own timeout; completion is
+    best-effort, so a broken channel layer never fails the task.
+    """
+    try:
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+        _get_loop().run_until_complete(
+            channel_layer.group_send(
+                f"job_logs_{job_id}",
+                {"type": "send_status", "status": str(status)},
+            )
+        )
+    except Exception as e:
+        logger.warning("Failed to publish terminal status for job %s: %s", job_id, e)
+
+
+def _handle_run_failure(task, job_id, exc):
+    """Retry if attempts remain, else persist the terminal failure
+
+    Nothing is written between retries — the old code saved FAILED plus a
+    growing stderr on every attempt. A retried job is put back to Queued
+    so the next delivery passes the queued->running gate. Always raises
+    (Retry or the original exception).
+    """
+    now = timezone.now()
+    if task.request.retries < task.max_retries:
+        logger.info(
+            "Retrying job %s (attempt %d/%d) after error: %s",
+            job_id, task.request.retries + 1, task.max_retries, exc,
+        )
+        Job.objects.filter(id=job_id).update(status=JobStatusChoice.QUEUED, modified_at=now)
+        task.retry(exc=exc)
+    logger.error("Job %s failed terminally with error: %s", job_id, exc)
+    Job.objects.filter(id=job_id).update(
+        stderr=str(exc),
+        status=JobStatusChoice.FAILED,
+        completed_at=now,
+        modified_at=now,
+    )
+    _publish_terminal_status(job_id, JobStatusChoice.FAILED.value)
+    raise exc
+
 
 @shared_task(bind=True, max_retries=3, retry_backoff=30)
 @inject
@@ -20,29 +103,33 @@ def run_job(
     execute_use_case: ExecuteRemoteCommandUseCase = Provide["execute_remote_command_use_case"],
 ):
     logger.info("Task called to run job with id %s request id: %s", job_id, self.request.id)
-    
-    job = Job.objects.get(id=job_id)
-    job.status = "Running"
-    job.started_at = timezone.now()
-    job.save()
+
+    # Atomic QUEUED -> RUNNING transition: if the job was cancelled (or a
+    # duplicate delivery already started it) the UPDATE matches nothing
+    # and the task must not execute the command
+    now = timezone.now()
+    updated = Job.objects.filter(id=job_id, status=JobStatusChoice.QUEUED).update(
+        status=JobStatusChoice.RUNNING, started_at=now, modified_at=now
+    )
+    if not updated:
+        logger.info("Job %s is no longer queued; skipping execution", job_id)
+        return {"job_id": job_id, "status": None}
+    job = Job.objects.only("command", "timeout").get(id=job_id)
 
     try:
         stdout, stderr = execute_use_case.execute(job.command, timeout=job.timeout)
-        job.stdout = stdout
-        job.stderr = stderr
-        job.status = "Success" if not stderr else "Failed"
-        logger.info("Job %s completed successfully with status %s", job_id, job.status)
     except Exception as e:
-        job.stderr = str(e)
-        job.status = "Failed"
-        logger.error("Job %s failed with error: %s", job_id, str(e))
-        if self.request.retries < self.max_retries:
-            logger.info("Retrying job %s (attempt %d/%d)", job_id, self.request.retries + 1, self.max_retries)
-            self.retry()
-    finally:
-        job.completed_at = timezone.now()
-        job.save()
-    
+        _handle_run_failure(self, job_id, e)
+
+    job.stdout = stdout
+    job.stderr = stderr
+    job.status = JobStatusChoice.SUCCESS if not stderr else JobStatusChoice.FAILED
+    job.completed_at = timezone.now()
+    job.modified_at = job.completed_at
+    job.save(update_fields=["stdout", "stderr", "status", "completed_at", "modified_at"])
+    logger.info("Job %s completed with status %s", job_id, job.status)
+    _publish_terminal_status(job_id, job.status)
+
     return {"job_id": job_id, "status": job.status}
 
 @shared_task(bind=True, max_retries=3, retry_backoff=30)
@@ -53,36 +140,34 @@ def run_job_streaming(
     streaming_use_case: ExecuteRemoteCommandStreamingUseCase = Provide["execute_remote_command_streaming_use_case"],
 ):
     logger.info("Task called to run streaming job with id %s request id: %s", job_id, self.request.id)
-    
-    job = Job.objects.get(id=job_id)
-    job.status = "Running"
-    job.started_at = timezone.now()
-    job.save()
+
+    now = timezone.now()
+    updated = Job.objects.filter(id=job_id, status=JobStatusChoice.QUEUED).update(
+        status=JobStatusChoice.RUNNING, started_at=now, modified_at=now
+    )
+    if not updated:
+        logger.info("Streaming job %s is no longer queued; skipping execution", job_id)
+        return {"job_id": job_id, "status": None}
+    job = Job.objects.only("command", "timeout").get(id=job_id)
 
     try:
-        stdout, stderr = async_to_sync(streaming_use_case.execute)(str(job.id), job.command, timeout=job.timeout)
-        job.stdout = stdout
-        job.stderr = stderr
-        job.status = "Success" if not stderr else "Failed"
-        logger.info("Streaming job %s completed successfully with status %s", job_id, job.status)
-    except TimeoutError as e:
-        job.stderr = str(e)
-        job.status = "Failed"
-        logger.error("Streaming job %s timed out: %s", job_id, str(e))
-        if self.request.retries < self.max_retries:
-            logger.info("Retrying streaming job %s (attempt %d/%d)", job_id, self.request.retries + 1, self.max_retries)
-            self.retry()
+        stdout, stderr = _get_loop().run_until_complete(
+            streaming_use_case.execute(str(job.id), job.command, timeout=job.timeout)
+        )
     except Exception as e:
-        job.stderr = str(e)
-        job.status = "Failed"
-        logger.error("Streaming job %s failed with error: %s", job_id, str(e))
-        if self.request.retries < self.max_retries:
-            logger.info("Retrying streaming job %s (attempt %d/%d)", job_id, self.request.retries + 1, self.max_retries)
-            self.retry()
-    finally:
-        job.completed_at = timezone.now()
-        job.save()
-    
+        # TimeoutError takes the same path — the old separate branch was
+        # a line-for-line duplicate of the generic one
+        _handle_run_failure(self, job_id, e)
+
+    job.stdout = stdout
+    job.stderr = stderr
+    job.status = JobStatusChoice.SUCCESS if not stderr else JobStatusChoice.FAILED
+    job.completed_at = timezone.now()
+    job.modified_at = job.completed_at
+    job.save(update_fields=["stdout", "stderr", "status", "completed_at", "modified_at"])
+    logger.info("Streaming job %s completed with status %s", job_id, job.status)
+    _publish_terminal_status(job_id, job.status)
+
     return {"job_id": job_id, "status": job.status}
 
 @shared_task(bind=True, max_retries=3, retry_backoff=30)
@@ -93,11 +178,14 @@ def cancel_job(
     kill_use_case: KillRemoteProcessUseCase = Provide["kill_remote_process_use_case"],
 ):
     from celery import current_app
-    
+
     logger.info("Task called to cancel job with id %s request id: %s", job_id, self.request.id)
 
-    job = Job.objects.get(id=job_id)
+    # Cancelling only needs the task/process ids — don't drag the
+    # potentially multi-MB stdout/stderr columns over the wire
+    job = Job.objects.only("id", "task_id", "remote_process_id").get(id=job_id)
 
+    error_msg = None
     if job.task_id:
         logger.info("Revoking Celery task %s for job %s", job.task_id, job_id)
         current_app.control.revoke(job.task_id, terminate=True, signal="SIGKILL")
@@ -108,12 +196,20 @@ def cancel_job(
             kill_use_case.execute(job.remote_process_id)
         except Exception as e:
             error_msg = f"Failed to kill remote process: {e}"
-            job.stderr = f"{job.stderr}\n{error_msg}" if job.stderr else error_msg
             logger.error("Failed to kill remote process %s for job %s: %s", job.remote_process_id, job_id, str(e))
 
-    job.status = "Cancelled"
-    job.completed_at = timezone.now()
-    job.save()
-    
+    now = timezone.now()
+    changes = {
+        "status": JobStatusChoice.CANCELLED,
+        "completed_at": now,
+        "modified_at": now,
+    }
+    if error_msg:
+        # Append server-side so the existing stderr text never leaves the
+        # database; Concat treats NULL as the empty string
+        changes["stderr"] = Concat("stderr", Value(f"\n{error_msg}"))
+    Job.objects.filter(id=job_id).update(**changes)
+    _publish_terminal_status(job_id, JobStatusChoice.CANCELLED.value)
+
     logger.info("Job %s cancelled successfully", job_id)
-    return {"job_id": job_id, "status": job.status}
+    return {"job_id": job_id, "status": JobStatusChoice.CANCELLED.value}
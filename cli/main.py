@@ -1,13 +1,38 @@
 import click
-import asyncio
-import websockets
-import json
+import os
 import sys
 import time
-from utils import Config, validate_job_id, make_request, handle_api_response, display_job_table
+from utils import Config, validate_job_id, make_request, get_job_cached, handle_api_response, display_job_table
 
 config = Config()
 
+
+def _setup_streaming():
+    """Import the websocket stack on first use.
+
+    asyncio/websockets/json only matter to the streaming and wait paths;
+    deferring them keeps plain submit/view/cancel invocations from paying
+    their import cost. Returns (asyncio, websockets, json).
+    """
+    import asyncio
+    import websockets
+
+    # orjson parses small log frames several times faster than stdlib
+    # json; both expose loads(), so the fallback is drop-in
+    try:
+        import orjson as json
+    except ImportError:
+        import json
+
+    # uvloop roughly halves per-frame overhead in the websocket recv loop;
+    # the CLI works unchanged without it
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    return asyncio, websockets, json
+
 @click.group()
 @click.option("--api-url", help="Override API URL")
 def cli(api_url):
@@ -23,7 +48,11 @@ def cli(api_url):
                 help="Timeout in seconds (1-3600)")
 @click.option("--stream", is_flag=True, help="Stream logs in real-time after submission")
 @click.option("--wait", is_flag=True, help="Wait for job completion before exiting")
-def submit(command, priority, timeout, stream, wait):
+@click.option("--poll-interval-min", default=1.0, type=click.FloatRange(0.1, 60),
+                help="Initial polling interval in seconds when waiting")
+@click.option("--poll-interval-max", default=30.0, type=click.FloatRange(0.1, 300),
+                help="Maximum polling interval in seconds when waiting")
+def submit(command, priority, timeout, stream, wait, poll_interval_min, poll_interval_max):
     # Input validation
     if not command.strip():
         click.secho("❌ Command cannot be empty", fg="red")
@@ -40,10 +69,8 @@ def submit(command, priority, timeout, stream, wait):
         "streaming": stream or wait
     }
     
-    with click.progressbar(length=1, label="Submitting job") as bar:
-        response = make_request("POST", f"{config.base_url}/", json=payload)
-        bar.update(1)
-    
+    response = make_request("POST", f"{config.base_url}/", json=payload)
+
     job = handle_api_response(response, f"✅ Job submitted successfully!")
     job_id = job['id']
     
@@ -54,54 +81,257 @@ def submit(command, priority, timeout, stream, wait):
         click.echo("Waiting for job to start...")
         stream_job_logs(job_id)
     elif wait:
-        wait_for_job_completion(job_id)
+        if not wait_via_ws(job_id):
+            wait_for_job_completion(job_id, poll_interval=(poll_interval_min, poll_interval_max))
+
+def submit_many(commands, priority="Medium", timeout=30, streaming=False):
+    """Submit several commands concurrently over one async client.
+
+    N coroutines on a shared connection pool replace N sequential POSTs
+    (or a thread per request); responses come back in input order.
+    """
+    import asyncio
+    from utils import async_make_request, make_async_client
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    async def run():
+        # One client shared by every coroutine — the pool lives here, not
+        # in per-task state
+        async with make_async_client() as client:
+            return await asyncio.gather(*[
+                async_make_request(client, "POST", f"{config.base_url}/", json={
+                    "command": command,
+                    "priority": priority,
+                    "timeout": timeout,
+                    "streaming": streaming,
+                })
+                for command in commands
+            ])
+
+    return asyncio.run(run())
+
+
+@cli.command("submit-many")
+@click.argument("commands", nargs=-1, required=True)
+@click.option("--priority", default="Medium",
+                type=click.Choice(["Low", "Medium", "High"], case_sensitive=False),
+                help="Priority of the jobs (Low, Medium, High)")
+@click.option("--timeout", default=30, type=click.IntRange(1, 3600),
+                help="Timeout in seconds (1-3600)")
+def submit_many_command(commands, priority, timeout):
+    """Submit multiple jobs in one concurrent batch."""
+    for command in commands:
+        if not command.strip():
+            click.secho("❌ Command cannot be empty", fg="red")
+            sys.exit(1)
+        if len(command) > 1000:
+            click.secho("❌ Command too long (max 1000 characters)", fg="red")
+            sys.exit(1)
+
+    responses = submit_many(list(commands), priority=priority.title(), timeout=timeout)
+
+    submitted = 0
+    for command, response in zip(commands, responses):
+        if response.status_code in (200, 201):
+            submitted += 1
+            click.secho(f"Job ID: {response.json().get('id')}", fg="cyan")
+        else:
+            click.secho(f"❌ Submission failed ({response.status_code}): {command[:40]}", fg="red")
+    click.secho(f"✅ {submitted}/{len(commands)} jobs submitted", fg="green")
+
+
+LOG_QUEUE_MAXSIZE = 1024
+LOG_FLUSH_INTERVAL = 0.02
+LOG_FLUSH_MAX_BYTES = 4096
+
+
+def _write_logs(buf: bytearray):
+    """Emit buffered log bytes with one os.write, skipping the
+    TextIOWrapper lock/encode/flush path print() would take per frame."""
+    os.write(sys.stdout.fileno(), bytes(buf))
+    buf.clear()
+
 
 def stream_job_logs(job_id: str, max_duration: int = 3600):
+    asyncio, websockets, json = _setup_streaming()
+
     async def stream_logs():
         uri = f"{config.ws_url}/{job_id}/"
-        timeout_time = time.time() + max_duration
-        
+        # Bounded queue between recv and stdout: a burst of log frames no
+        # longer stalls the recv coroutine behind blocking prints (which
+        # would back frames up in the server's send buffer)
+        log_queue = asyncio.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+
+        def enqueue(log):
+            if log_queue.full():
+                # Drop the oldest rather than stall the reader
+                log_queue.get_nowait()
+            log_queue.put_nowait(log)
+
+        async def writer():
+            buf = bytearray()
+            try:
+                while True:
+                    # Collect for a short window and emit one write syscall
+                    buf += (await log_queue.get()).encode("utf-8", "replace")
+                    await asyncio.sleep(LOG_FLUSH_INTERVAL)
+                    while not log_queue.empty():
+                        buf += log_queue.get_nowait().encode("utf-8", "replace")
+                        if len(buf) >= LOG_FLUSH_MAX_BYTES:
+                            _write_logs(buf)
+                    if buf:
+                        _write_logs(buf)
+            except asyncio.CancelledError:
+                # Cancellation usually lands in the flush-window sleep —
+                # emit whatever was already pulled off the queue so the
+                # tail of the stream isn't dropped
+                if buf:
+                    _write_logs(buf)
+                raise
+
+        async def reader(websocket):
+            # One overall deadline is enforced by wait_for around this
+            # coroutine; recv() runs bare instead of being re-wrapped in a
+            # short wait_for (and timer heap entry) per frame
+            while True:
+                message = await websocket.recv()
+                data = json.loads(message)
+                log = data.get("log", "")
+                if log:
+                    enqueue(log)
+
+                # Check if job is completed
+                if data.get("status") in ["Success", "Failed", "Cancelled"]:
+                    click.secho(f"\n✅ Job completed with status: {data.get('status')}", fg="green")
+                    return
+
         try:
-            async with websockets.connect(uri) as websocket:
+            async with websockets.connect(uri, compression=None) as websocket:
                 click.secho(f"📡 Connected to live logs for job {job_id}...\n", fg="cyan")
-                
-                while time.time() < timeout_time:
+                # Drain the text wrapper's buffer before raw fd writes so
+                # output stays ordered
+                sys.stdout.flush()
+
+                writer_task = asyncio.create_task(writer())
+                try:
+                    await asyncio.wait_for(reader(websocket), timeout=max_duration)
+                except asyncio.TimeoutError:
+                    click.secho(f"\n⏰ Timeout after {max_duration} seconds", fg="yellow")
+                finally:
+                    # Flush whatever the writer hasn't picked up yet; await
+                    # the cancellation so the writer's own buffer is written
+                    # before the queue leftovers
+                    writer_task.cancel()
                     try:
-                        message = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                        data = json.loads(message)
-                        log = data.get("log", "")
-                        if log:
-                            print(log, end="")
-                        
-                        # Check if job is completed
-                        if data.get("status") in ["Success", "Failed", "Cancelled"]:
-                            click.secho(f"\n✅ Job completed with status: {data.get('status')}", fg="green")
-                            break
-                            
-                    except asyncio.TimeoutError:
-                        continue  # Keep trying
-                        
+                        await writer_task
+                    except asyncio.CancelledError:
+                        pass
+                    remaining = bytearray()
+                    while not log_queue.empty():
+                        remaining += log_queue.get_nowait().encode("utf-8", "replace")
+                    if remaining:
+                        _write_logs(remaining)
+
                 click.secho("\n📡 Log stream finished.", fg="green")
-                
+
         except websockets.exceptions.ConnectionClosed:
             click.secho("\n✅ Job log stream finished.", fg="green")
         except websockets.exceptions.InvalidURI:
             click.secho(f"❌ Invalid WebSocket URI: {uri}", fg="red")
         except Exception as e:
             click.secho(f"❌ WebSocket error: {e}", fg="red")
-    
+
     try:
         asyncio.run(stream_logs())
     except KeyboardInterrupt:
         click.secho("\n🛑 Log streaming interrupted by user", fg="yellow")
 
-def wait_for_job_completion(job_id: str, poll_interval: int = 2, max_wait: int = 3600):
+def wait_via_ws(job_id: str, max_duration: int = 3600) -> bool:
+    """Wait for completion over the log WebSocket instead of polling.
+
+    One persistent connection replaces a GET per poll and reports the
+    terminal status as soon as the server pushes it. Log frames are
+    discarded. Returns False when the socket can't be reached so the
+    caller can fall back to REST polling.
+    """
+    asyncio, websockets, json = _setup_streaming()
+
+    async def wait():
+        uri = f"{config.ws_url}/{job_id}/"
+
+        async with websockets.connect(uri, compression=None) as websocket:
+            # The status frame is only pushed when the job *finishes* — a
+            # short command can go terminal before this socket joined the
+            # group. One REST check settles that race; done after connect
+            # so a finish in between still reaches us as a frame. (The
+            # blocking GET is fine: any frames just buffer meanwhile.)
+            response = make_request("GET", f"{config.base_url}/{job_id}/")
+            if response.status_code == 200:
+                status = response.json().get("status")
+                if status in ["Success", "Failed", "Cancelled"]:
+                    click.secho(f"\n✅ Job completed with status: {status}", fg="green")
+                    return True
+            try:
+                # Single deadline around the whole wait; each recv() runs
+                # bare rather than inside its own 5s wait_for
+                return await asyncio.wait_for(_wait_for_terminal(websocket), timeout=max_duration)
+            except asyncio.TimeoutError:
+                # No terminal frame arrived (e.g. a server that only
+                # pushes logs) — let the caller confirm via REST polling
+                return False
+
+    async def _wait_for_terminal(websocket):
+        while True:
+            data = json.loads(await websocket.recv())
+            status = data.get("status")
+            if status in ["Success", "Failed", "Cancelled"]:
+                click.secho(f"\n✅ Job completed with status: {status}", fg="green")
+                return True
+
+    try:
+        return asyncio.run(wait())
+    except KeyboardInterrupt:
+        click.secho("\n🛑 Wait interrupted by user", fg="yellow")
+        return True
+    except (websockets.exceptions.InvalidURI, OSError):
+        # No WebSocket endpoint reachable — let the caller poll instead
+        return False
+    except websockets.exceptions.ConnectionClosed:
+        # Stream ended without an explicit status; a quick poll settles it
+        return False
+
+
+def wait_for_job_completion(job_id: str, poll_interval: tuple = (1.0, 30.0), max_wait: int = 3600):
     start_time = time.time()
-    
+    # Adaptive backoff: poll quickly while the job is changing state, back
+    # off geometrically while it idles, reset on any status change
+    min_interval, max_interval = poll_interval
+    interval = min_interval
+    last_status = None
+
+    # Server-side long-poll: one held GET replaces ~30 polls. Flipped off
+    # on 400 from servers that don't understand ?wait=
+    use_wait = True
+
     with click.progressbar(length=max_wait, label="Waiting for completion") as bar:
         while time.time() - start_time < max_wait:
             try:
-                response = make_request("GET", f"{config.base_url}/{job_id}/")
+                if use_wait:
+                    remaining = max_wait - (time.time() - start_time)
+                    wait_seconds = int(min(30, max(1, remaining)))
+                    response = make_request(
+                        "GET", f"{config.base_url}/{job_id}/?wait={wait_seconds}",
+                        timeout=wait_seconds + 5,
+                    )
+                    if response.status_code == 400:
+                        use_wait = False
+                        continue
+                else:
+                    response = make_request("GET", f"{config.base_url}/{job_id}/")
                 job = handle_api_response(response)
                 
                 status = job.get('status', 'Unknown')
@@ -121,7 +351,16 @@ def wait_for_job_completion(job_id: str, poll_interval: int = 2, max_wait: int =
                 
                 elapsed = int(time.time() - start_time)
                 bar.update(min(elapsed, max_wait))
-                time.sleep(poll_interval)
+
+                # The long-poll already blocked server-side; only the
+                # fallback path needs client-side pacing
+                if not use_wait:
+                    if status == last_status:
+                        interval = min(interval * 1.5, max_interval)
+                    else:
+                        interval = min_interval
+                        last_status = status
+                    time.sleep(interval)
                 
             except KeyboardInterrupt:
                 click.secho("\n🛑 Wait interrupted by user", fg="yellow")
@@ -130,57 +369,100 @@ def wait_for_job_completion(job_id: str, poll_interval: int = 2, max_wait: int =
     click.secho(f"\n⏰ Timeout after {max_wait} seconds", fg="yellow")
 
 @cli.command()
-@click.argument("job_id", required=True)
-@click.option("--format", "-f", type=click.Choice(["table", "json"]), 
+@click.argument("job_ids", nargs=-1, required=True)
+@click.option("--format", "-f", type=click.Choice(["table", "json"]),
                 default="table", help="Output format")
 @click.option("--follow", is_flag=True, help="Follow job status updates")
-def view(job_id, format, follow):
+@click.option("--poll-interval-min", default=1.0, type=click.FloatRange(0.1, 60),
+                help="Initial polling interval in seconds with --follow")
+@click.option("--poll-interval-max", default=30.0, type=click.FloatRange(0.1, 300),
+                help="Maximum polling interval in seconds with --follow")
+@click.option("--refresh", is_flag=True, help="Bypass the short-lived job cache")
+def view(job_ids, format, follow, poll_interval_min, poll_interval_max, refresh):
     # Validate job ID format
-    if not validate_job_id(job_id):
-        click.secho("❌ Invalid job ID format (expected UUID)", fg="red")
-        sys.exit(1)
-    
+    for job_id in job_ids:
+        if not validate_job_id(job_id):
+            click.secho(f"❌ Invalid job ID format (expected UUID): {job_id}", fg="red")
+            sys.exit(1)
+
     if follow:
-        follow_job_status(job_id)
+        follow_job_status(job_ids, poll_interval=(poll_interval_min, poll_interval_max))
         return
-    
-    response = make_request("GET", f"{config.base_url}/{job_id}/")
-    job = handle_api_response(response, "✅ Job details retrieved")
-    
-    if format == "json":
-        click.echo(json.dumps(job, indent=2))
-    else:
-        display_job_table(job)
 
-def follow_job_status(job_id: str, poll_interval: int = 2):
-    click.secho(f"📡 Following job {job_id} (Ctrl+C to stop)...\n", fg="cyan")
-    
-    last_status = None
+    for job_id in job_ids:
+        response = get_job_cached(config.base_url, job_id, refresh=refresh)
+        job = handle_api_response(response, "✅ Job details retrieved")
+
+        if format == "json":
+            try:
+                import orjson
+                click.echo(orjson.dumps(job, option=orjson.OPT_INDENT_2).decode())
+            except ImportError:
+                import json
+                click.echo(json.dumps(job, indent=2))
+        else:
+            display_job_table(job)
+
+def follow_job_status(job_ids, poll_interval: tuple = (1.0, 30.0)):
+    """Follow one or more jobs until every one reaches a terminal status.
+
+    Multiple jobs are polled with a single batched GET /?ids=... per tick
+    rather than one request per job, so following N jobs costs the same
+    number of roundtrips as following one.
+    """
+    click.secho(f"📡 Following {', '.join(job_ids)} (Ctrl+C to stop)...\n", fg="cyan")
+
+    # validate_job_id accepts uppercase UUIDs but the server reports ids
+    # lowercase — normalize so pending/last_status lookups actually match
+    job_ids = [job_id.lower() for job_id in job_ids]
+    min_interval, max_interval = poll_interval
+    interval = min_interval
+    last_status = {job_id: None for job_id in job_ids}
+    pending = set(job_ids)
+    batched = len(job_ids) > 1
     try:
-        while True:
-            response = make_request("GET", f"{config.base_url}/{job_id}/")
-            job = handle_api_response(response)
-            
-            current_status = job.get('status')
-            if current_status != last_status:
-                timestamp = time.strftime("%H:%M:%S")
-                click.secho(f"[{timestamp}] Status: {current_status}", fg="yellow")
-                last_status = current_status
-                
-                if current_status in ['Success', 'Failed', 'Cancelled']:
-                    click.secho(f"\n✅ Job finished with status: {current_status}", fg="green")
-                    display_job_table(job)
-                    break
-            
-            time.sleep(poll_interval)
-            
+        while pending:
+            if batched:
+                response = make_request("GET", f"{config.base_url}/list/?ids={','.join(job_ids)}")
+                jobs = handle_api_response(response).get('jobs', [])
+            else:
+                response = make_request("GET", f"{config.base_url}/{job_ids[0]}/")
+                jobs = [handle_api_response(response)]
+
+            changed = False
+            for job in jobs:
+                job_id = str(job.get('id'))
+                current_status = job.get('status')
+                if current_status != last_status.get(job_id):
+                    timestamp = time.strftime("%H:%M:%S")
+                    prefix = f"[{timestamp}] {job_id}: " if batched else f"[{timestamp}] Status: "
+                    click.secho(f"{prefix}{current_status}", fg="yellow")
+                    last_status[job_id] = current_status
+                    changed = True
+
+                    if current_status in ['Success', 'Failed', 'Cancelled']:
+                        pending.discard(job_id)
+                        click.secho(f"\n✅ Job finished with status: {current_status}", fg="green")
+                        if batched:
+                            # The list payload omits stdout/stderr, so fetch
+                            # the full row once for the final table
+                            response = get_job_cached(config.base_url, job_id, refresh=True)
+                            job = handle_api_response(response)
+                        display_job_table(job)
+
+            if not pending:
+                break
+            interval = min_interval if changed else min(interval * 1.5, max_interval)
+            time.sleep(interval)
+
     except KeyboardInterrupt:
         click.secho("\n🛑 Status following stopped by user", fg="yellow")
 
 @cli.command()
 @click.argument("job_id", required=True)  
 @click.option("--force", is_flag=True, help="Force cancellation without confirmation")
-def cancel(job_id, force):
+@click.option("--refresh", is_flag=True, help="Bypass the short-lived job cache")
+def cancel(job_id, force, refresh):
     # Validate job ID format
     if not validate_job_id(job_id):
         click.secho("❌ Invalid job ID format (expected UUID)", fg="red")
@@ -188,7 +470,7 @@ def cancel(job_id, force):
     
     # Get job status first
     try:
-        response = make_request("GET", f"{config.base_url}/{job_id}/")
+        response = get_job_cached(config.base_url, job_id, refresh=refresh)
         job = handle_api_response(response)
         current_status = job.get('status')
         
@@ -214,7 +496,8 @@ def cancel(job_id, force):
     
     # Optionally wait to confirm cancellation
     if click.confirm("Wait to confirm cancellation?", default=False):
-        response = make_request("GET", f"{config.base_url}/{job_id}/")
+        # The status just changed server-side, so always bypass the cache
+        response = get_job_cached(config.base_url, job_id, refresh=True)
         job = handle_api_response(response)
         click.secho(f"Job status updated to: {job.get('status')}", fg="cyan")
 
@@ -222,7 +505,8 @@ def cancel(job_id, force):
 @click.argument("job_id", required=True)
 @click.option("--duration", "-d", default=3600, type=click.IntRange(1, 86400),
                 help="Maximum streaming duration in seconds (default: 3600)")
-def stream(job_id, duration):
+@click.option("--refresh", is_flag=True, help="Bypass the short-lived job cache")
+def stream(job_id, duration, refresh):
     # Validate job ID format
     if not validate_job_id(job_id):
         click.secho("❌ Invalid job ID format (expected UUID)", fg="red")
@@ -230,7 +514,7 @@ def stream(job_id, duration):
     
     # Check if job exists and is streamable
     try:
-        response = make_request("GET", f"{config.base_url}/{job_id}/")
+        response = get_job_cached(config.base_url, job_id, refresh=refresh)
         job = handle_api_response(response)
         status = job.get('status')
         
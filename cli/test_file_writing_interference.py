@@ -1,26 +1,71 @@
+import asyncio
+import re
+import sys
 import time
 import random
-import concurrent.futures
+import pytest
 from click.testing import CliRunner
-from main import submit
+from main import submit, view
+from utils import Config, make_request
 
+config = Config()
+
+# Seeded generator: deterministic job ids across runs (easier log
+# diffing) without touching the global random state
+_rng = random.Random(0x1234)
+
+# START/END markers written by the print-job commands
+_MARKER_RE = re.compile(r"=== PRINT JOB (JOB\d+) (START|END) ===")
+
+
+def _job_status(job_id):
+    """Fetch just the current status of a job over HTTP."""
+    response = make_request("GET", f"{config.base_url}/{job_id}/")
+    if response.status_code != 200:
+        return None
+    return response.json().get("status")
+
+
+def _wait_for_jobs(job_ids, timeout=30.0, interval=0.25):
+    """Poll until every job is terminal or the timeout elapses."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        statuses = [_job_status(jid) for jid in job_ids]
+        if all(s in ("Success", "Failed", "Cancelled") for s in statuses):
+            return True
+        time.sleep(interval)
+    return False
+
+# Real commands against the backend plus multi-second waits; excluded
+# from default runs, opt in with --runslow. Pinned to one worker under
+# pytest-xdist --dist=loadgroup: the test owns shared remote state
+# (/tmp/shared_printer.txt) and drives its own concurrency
+@pytest.mark.slow
+@pytest.mark.xdist_group("serial")
 def test_file_writing_interference():
     """Test Case 2: File writing interference race condition"""
+    # Deferred: the test is skipped without --runslow, so collection
+    # shouldn't pay for the HTTP client stack
+    import httpx
+
     runner = CliRunner()
-    
-    print("\n🖨️ SCENARIO: 6 people sending print jobs to shared printer simultaneously")
-    print("📋 Expected: Print jobs should complete in order without mixing")
-    print("🎯 Testing: Race condition in concurrent file writing operations\n")
-    
+    # Report lines are buffered and written once at the end — one stdio
+    # write instead of ~40 per-print flushes
+    out = []
+
+    out.append("\n🖨️ SCENARIO: 6 people sending print jobs to shared printer simultaneously")
+    out.append("📋 Expected: Print jobs should complete in order without mixing")
+    out.append("🎯 Testing: Race condition in concurrent file writing operations\n")
+
     # Clear shared printer file before starting
     runner.invoke(submit, ["rm -f /tmp/shared_printer.txt", "--wait"])
-    
+
     # Generate unique print job IDs
-    job_ids = [f"JOB{random.randint(100, 999)}" for _ in range(6)]
-    
-    def send_print_job(job_id):
-        """Simulate sending a print job with logging and file writing"""
-        print_cmd = f"""
+    job_ids = [f"JOB{_rng.randint(100, 999)}" for _ in range(6)]
+
+    def print_command(job_id):
+        """Shell command simulating a print job with logging and file writing"""
+        return f"""
 echo "📄 {job_id}: Print job submitted to shared printer";
 echo "🖨️  {job_id}: Starting to print document...";
 echo "=== PRINT JOB {job_id} START ===" >> /tmp/shared_printer.txt;
@@ -31,98 +76,109 @@ echo "=== PRINT JOB {job_id} END ===" >> /tmp/shared_printer.txt;
 echo "✅ {job_id}: Print job completed successfully";
 LINES=$(wc -l < /tmp/shared_printer.txt);
 echo "📊 {job_id}: Total lines in printer file: $LINES"
-        """
-        return runner.invoke(submit, [print_cmd.strip()])
-    
-    print("🚀 Sending 6 concurrent print jobs to remote shared printer...")
-    
-    # Fire all print jobs simultaneously
-    with concurrent.futures.ThreadPoolExecutor(max_workers=6) as executor:
-        futures = [executor.submit(send_print_job, job_id) for job_id in job_ids]
-        results = [future.result() for future in futures]
-    
-    # Collect job IDs
+        """.strip()
+
+    async def send_print_job(client, job_id):
+        return await client.post(f"{config.base_url}/", json={
+            "command": print_command(job_id),
+            "priority": "Medium",
+            "timeout": 30,
+            "streaming": False,
+        })
+
+    async def submit_all():
+        # 6 coroutines on one keep-alive connection pool instead of 6
+        # threads each running a full CliRunner invocation — fires the
+        # submissions closer together, which is the point of a race test
+        limits = httpx.Limits(max_keepalive_connections=6)
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            return await asyncio.gather(*(send_print_job(client, j) for j in job_ids))
+
+    out.append("🚀 Sending 6 concurrent print jobs to remote shared printer...")
+    results = asyncio.run(submit_all())
+
+    # Collect job IDs straight from the JSON responses
     print_job_ids = []
     accepted_jobs = 0
-    for i, result in enumerate(results):
-        if result.exit_code == 0:
+    for name, response in zip(job_ids, results):
+        if response.status_code in (200, 201):
             accepted_jobs += 1
-            lines = result.output.strip().split('\n')
-            for line in lines:
-                if "Job ID:" in line:
-                    job_id = line.split("Job ID: ")[1].strip()
-                    print_job_ids.append((job_ids[i], job_id))
-                    break
-    
-    print(f"\n📈 Print jobs fired: {len(job_ids)}")
-    print(f"📨 Jobs accepted by system: {accepted_jobs}")
-    
-    # Wait for print jobs to complete
-    print("\n⏳ Waiting for print jobs to complete...")
-    time.sleep(5)
-    
+            remote_id = response.json().get("id")
+            if remote_id:
+                print_job_ids.append((name, remote_id))
+
+    out.append(f"\n📈 Print jobs fired: {len(job_ids)}")
+    out.append(f"📨 Jobs accepted by system: {accepted_jobs}")
+
+    # Wait for print jobs to complete — poll rather than a fixed sleep,
+    # so the test finishes as soon as the jobs do
+    out.append("\n⏳ Waiting for print jobs to complete...")
+    if not _wait_for_jobs([jid for _, jid in print_job_ids]):
+        out.append("⚠️  Some jobs did not finish within 30s, checking anyway")
+
     # Check individual print job results using the view command
-    print("\n📋 PRINT JOB RESULTS:")
-    print("=" * 60)
+    out.append("\n📋 PRINT JOB RESULTS:")
+    out.append("=" * 60)
     completed_jobs = 0
-    
+
     for job_id_name, job_id in print_job_ids:
-        print(f"🔍 Checking {job_id_name} (Job: {job_id[:8]}...):")
-        view_result = runner.invoke(submit, ["view", job_id])
-        
+        out.append(f"🔍 Checking {job_id_name} (Job: {job_id[:8]}...):")
+        view_result = runner.invoke(view, [job_id])
+
         if view_result.exit_code == 0:
             if "Print job completed successfully" in str(view_result.output):
-                print(f"   ✅ {job_id_name}: Print job completed successfully")
+                out.append(f"   ✅ {job_id_name}: Print job completed successfully")
                 completed_jobs += 1
             else:
-                print(f"   ❌ {job_id_name}: Print job failed or incomplete")
-            
+                out.append(f"   ❌ {job_id_name}: Print job failed or incomplete")
+
             # Show key parts of the job output
-            lines = view_result.output.split('\n')
-            for line in lines:
+            for line in view_result.output.split('\n'):
                 if f"{job_id_name}:" in line and ("completed" in line or "submitted" in line):
-                    print(f"   📝 {line.strip()}")
+                    out.append(f"   📝 {line.strip()}")
         else:
-            print(f"   ⚠️  Could not view job {job_id_name}")
-    
+            out.append(f"   ⚠️  Could not view job {job_id_name}")
+
     # Show final printer output and check for interference
-    print("\n📄 Final printer file contents:")
+    out.append("\n📄 Final printer file contents:")
     content_result = runner.invoke(submit, ["cat /tmp/shared_printer.txt", "--wait"])
     printer_content = content_result.output.strip()
-    
+
     if printer_content:
         lines = [line for line in printer_content.split('\n') if line.strip()]
         for i, line in enumerate(lines[-15:], 1):  # Show last 15 lines
-            print(f"   {i:2d}: {line.strip()}")
-        
-        # Check for interference (interleaved job segments)
+            out.append(f"   {i:2d}: {line.strip()}")
+
+        # Check for interference (interleaved job segments): one regex
+        # pass over the raw content plus a forward scan of the matches,
+        # instead of substring probes on every line
         interference_detected = False
         current_job = None
-        
-        for line in lines:
-            if "START" in line and "JOB" in line:
-                current_job = line.split("JOB")[1].split()[0]
-            elif "END" in line and "JOB" in line:
-                end_job = line.split("JOB")[1].split()[0]
-                if current_job != end_job:
-                    interference_detected = True
-                    break
-        
-        print("=" * 60)
-        print(f"📊 PRINT JOB SUMMARY:")
-        print(f"   📄 Jobs completed successfully: {completed_jobs}")
-        print(f"   🖨️  Interference detected: {'YES' if interference_detected else 'NO'}")
-        print(f"   🎯 File writing test: {'INTERFERENCE FOUND' if interference_detected else 'CLEAN OUTPUT'}")
+
+        for marker_job, marker_kind in _MARKER_RE.findall(printer_content):
+            if marker_kind == "START":
+                current_job = marker_job
+            elif current_job != marker_job:
+                interference_detected = True
+                break
+
+        out.append("=" * 60)
+        out.append(f"📊 PRINT JOB SUMMARY:")
+        out.append(f"   📄 Jobs completed successfully: {completed_jobs}")
+        out.append(f"   🖨️  Interference detected: {'YES' if interference_detected else 'NO'}")
+        out.append(f"   🎯 File writing test: {'INTERFERENCE FOUND' if interference_detected else 'CLEAN OUTPUT'}")
     else:
-        print("❌ No printer output found")
+        out.append("❌ No printer output found")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     print("🔬 === REAL RACE CONDITION TESTING SUITE ===")
     print("🎯 Testing concurrent command execution on remote system")
     print("⚡ No mocks - Real commands, Real race conditions\n")
-    
+
     # Run the tests
     test_file_writing_interference()
-    
+
     print("\n🏁 === RACE CONDITION TESTS COMPLETE ===")
     print("📊 Check the streamed output above for detailed results")
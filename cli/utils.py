@@ -1,151 +1,280 @@
+import atexit
 import click
+import re
 import requests
 import json
 import sys
-import uuid
+import time
 import os
+from datetime import datetime
 from typing import Optional, Dict, Any
 
+# orjson encodes/decodes JSON bodies several times faster than stdlib
+# json; the CLI works unchanged without it
+try:
+    import orjson as _fastjson
+except ImportError:
+    _fastjson = None
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One session for the whole process: polling loops make dozens to
+# thousands of requests against the same host, and a shared pool reuses
+# the TCP/TLS connection instead of handshaking per call. Pool sizes
+# cover the stress scenarios (50 concurrent submits) without evicting
+# keep-alive sockets
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+atexit.register(_session.close)
+
+
+def _load_env_file():
+    """Merge .env into os.environ once per interpreter.
+
+    Parsing at import means constructing Config() repeatedly (one per
+    CLI invocation in the stress tests) no longer re-reads the file.
+    """
+    env_file = os.path.join(os.path.dirname(__file__), '.env')
+    if not os.path.exists(env_file):
+        return
+    with open(env_file) as f:
+        for line in f:
+            if line.startswith('#'):
+                continue
+            key, sep, value = line.strip().partition('=')
+            if sep:
+                os.environ.setdefault(key, value)
+
+
+_load_env_file()
+
 
 class Config:
     def __init__(self):
-        env_file = os.path.join(os.path.dirname(__file__), '.env')
-        if os.path.exists(env_file):
-            with open(env_file) as f:
-                for line in f:
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.strip().split('=', 1)
-                        os.environ.setdefault(key, value)
-
         self.base_url = os.getenv("REMOTE_JOB_API_URL", "http://localhost:8000/jobs")
         self.ws_url = os.getenv("REMOTE_JOB_WS_URL", "ws://localhost:8000/ws/jobs")
 
 
+# Compiled once at import; a regex fullmatch is several times cheaper
+# than constructing a uuid.UUID just to throw it away
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    re.IGNORECASE,
+)
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
 def validate_job_id(job_id: str) -> bool:
     """Validate job ID format (UUID)."""
-    if job_id is None:
-        return False
-    try:
-        uuid.UUID(job_id)
-        return True
-    except (ValueError, TypeError):
+    if not isinstance(job_id, str):
         return False
+    # Fast path for the canonical 36-char form: plain length/charset
+    # checks, no regex engine involved
+    if len(job_id) == 36 and job_id[8] == job_id[13] == job_id[18] == job_id[23] == "-":
+        digits = job_id.lower().replace("-", "")
+        return len(digits) == 32 and all(c in _HEX_DIGITS for c in digits)
+    return _UUID_RE.fullmatch(job_id) is not None
+
+
+# Recently fetched job payloads: job_id -> (fetched_at, response). Chained
+# commands (view -> cancel -> stream) re-fetch the same job within a couple
+# of seconds; a tiny TTL cache halves those round trips
+_JOB_CACHE: Dict[str, tuple] = {}
+JOB_CACHE_TTL_SECONDS = 2.0
+
+
+def get_job_cached(base_url: str, job_id: str, ttl: float = JOB_CACHE_TTL_SECONDS,
+                   refresh: bool = False) -> requests.Response:
+    """GET a job, reusing a response fetched less than ttl seconds ago."""
+    now = time.monotonic()
+    if not refresh:
+        cached = _JOB_CACHE.get(job_id)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+    response = make_request("GET", f"{base_url}/{job_id}/")
+    _JOB_CACHE[job_id] = (now, response)
+    return response
+
+
+def make_async_client():
+    """Build the pooled client for fan-out paths (e.g. submit-many).
+
+    The caller owns the client and shares it across gathered coroutines
+    (asyncio.gather runs each task in a copied context, so stashing the
+    client in a ContextVar would silently give every task its own pool).
+    httpx is imported lazily so plain sync commands don't pay for it.
+    """
+    import httpx
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=30,
+    )
+
+
+async def async_make_request(client, method: str, url: str, **kwargs):
+    """Async counterpart of make_request over a caller-owned client."""
+    method = method.upper()
+    if method not in ("GET", "POST"):
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    return await client.request(method, url, **kwargs)
+
+
+# Built once: requests merges (not mutates) passed headers, so sharing
+# the dict across calls is safe; the float timeout skips the int→float
+# conversion inside urllib3
+_DEFAULT_HEADERS = {"Content-Type": "application/json"}
+_DEFAULT_TIMEOUT = 30.0
 
 
 def make_request(method: str, url: str, **kwargs) -> requests.Response:
     """Make HTTP request with basic error handling."""
-    kwargs.setdefault("timeout", 30)
-    kwargs.setdefault("headers", {"Content-Type": "application/json"})
-    
+    kwargs.setdefault("timeout", _DEFAULT_TIMEOUT)
+    if "headers" not in kwargs:
+        kwargs["headers"] = _DEFAULT_HEADERS
+
+    # Pre-serialize json= payloads with orjson instead of letting
+    # requests run them through stdlib json
+    if _fastjson is not None and "json" in kwargs:
+        kwargs["data"] = _fastjson.dumps(kwargs.pop("json"))
+
+    method = method.upper()
+    if method not in ("GET", "POST"):
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
     try:
-        if method.upper() == "GET":
-            response = requests.get(url, **kwargs)
-        elif method.upper() == "POST":
-            response = requests.post(url, **kwargs)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        
-        return response
-        
+        return _session.request(method, url, **kwargs)
+
     except requests.exceptions.RequestException as e:
         click.secho(f"❌ Request failed: {e}", fg="red")
         sys.exit(1)
 
 
+def _loads(content: bytes):
+    if _fastjson is not None:
+        return _fastjson.loads(content)
+    return json.loads(content)
+
+
 def handle_api_response(response: requests.Response, success_message: str = None) -> Optional[Dict[Any, Any]]:
     """Handle API response with proper error handling."""
-    try:
-        if response.status_code in [200, 201]:
-            if success_message:
-                click.secho(success_message, fg="green")
-            return response.json() if response.content else None
-        elif response.status_code == 400:
-            error_data = response.json() if response.content else {}
-            click.secho("❌ Bad Request:", fg="red")
-            if "error" in error_data:
-                click.echo(f"   {error_data['error']}")
-            if "details" in error_data:
-                for detail in error_data.get("details", []):
-                    click.echo(f"   - {detail.get('msg', detail)}")
-        elif response.status_code == 404:
-            click.secho("❌ Resource not found", fg="red")
-        elif response.status_code == 500:
-            click.secho("❌ Server error - please try again later", fg="red")
-        else:
-            click.secho(f"❌ Request failed with status {response.status_code}", fg="red")
-            click.echo(response.text)
-        
-        sys.exit(1)
-    except json.JSONDecodeError:
-        click.secho("❌ Invalid response from server", fg="red")
-        sys.exit(1)
+    status_code = response.status_code
+    # Hot path first: successful responses parse exactly once and
+    # return without touching the error branching below
+    if status_code < 300:
+        if success_message:
+            click.secho(success_message, fg="green")
+        try:
+            return _loads(response.content) if response.content else None
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+        except ValueError:
+            click.secho("❌ Invalid response from server", fg="red")
+            sys.exit(1)
+
+    if status_code == 400:
+        try:
+            error_data = _loads(response.content) if response.content else {}
+        except ValueError:
+            error_data = {}
+        click.secho("❌ Bad Request:", fg="red")
+        if "error" in error_data:
+            click.echo(f"   {error_data['error']}")
+        if "details" in error_data:
+            for detail in error_data.get("details", []):
+                click.echo(f"   - {detail.get('msg', detail)}")
+    elif status_code == 404:
+        click.secho("❌ Resource not found", fg="red")
+    elif status_code == 500:
+        click.secho("❌ Server error - please try again later", fg="red")
+    else:
+        click.secho(f"❌ Request failed with status {status_code}", fg="red")
+        click.echo(response.text)
+
+    sys.exit(1)
+
+
+# fromisoformat accepts the trailing Z natively on 3.11+; the fallback
+# closure keeps the .replace only where it's needed
+if sys.version_info >= (3, 11):
+    _parse_ts = datetime.fromisoformat
+else:
+    def _parse_ts(timestamp):
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
 
 
 def format_timestamp(timestamp: Optional[str]) -> str:
     """Format timestamp for display."""
     if not timestamp:
         return "(not set)"
-    
+
     try:
-        from datetime import datetime
-        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-    except:
+        return _parse_ts(timestamp).strftime("%Y-%m-%d %H:%M:%S UTC")
+    except (ValueError, AttributeError, TypeError):
         return timestamp
 
 
+# Status→color mapping built once instead of per rendered table, with
+# the styled strings pre-rendered so the hot path is one dict lookup
+_STATUS_COLOR = {
+    'Success': 'green',
+    'Failed': 'red',
+    'Running': 'yellow',
+    'Queued': 'blue',
+    'Cancelled': 'magenta',
+}
+_STATUS_STYLED = {k: click.style(k, fg=v) for k, v in _STATUS_COLOR.items()}
+
+
 def display_job_table(job: Dict[str, Any]):
-    """Display job information in a nice table format."""
-    click.secho(f"\n📄 Job Details", bold=True, fg="cyan")
-    click.echo("─" * 50)
-    
-    # Basic info
-    click.echo(f"{'ID':<12}: {job['id']}")
-    click.echo(f"{'Command':<12}: {job['command'][:60]}{'...' if len(job['command']) > 60 else ''}")
-    
-    # Status with color coding
+    """Display job information in a nice table format.
+
+    The whole table is assembled into one string and emitted with a
+    single echo — one stdout write instead of ~15 individually flushed
+    calls (click.echo still strips styling for non-tty streams).
+    """
+    command = job['command']
     status = job['status']
-    status_color = {
-        'Success': 'green',
-        'Failed': 'red', 
-        'Running': 'yellow',
-        'Queued': 'blue',
-        'Cancelled': 'magenta'
-    }.get(status, 'white')
-    
-    click.echo(f"{'Status':<12}: ", nl=False)
-    click.secho(f"{status}", fg=status_color)
-    
-    click.echo(f"{'Priority':<12}: {job['priority']}")
-    click.echo(f"{'Timeout':<12}: {job['timeout']}s")
-    
-    # Timestamps
-    click.echo(f"{'Created':<12}: {format_timestamp(job.get('created_at'))}")
-    click.echo(f"{'Started':<12}: {format_timestamp(job.get('started_at'))}")  
-    click.echo(f"{'Completed':<12}: {format_timestamp(job.get('completed_at'))}")
-    
+    parts = [
+        click.style("\n📄 Job Details", bold=True, fg="cyan"), "\n",
+        "─" * 50, "\n",
+        f"{'ID':<12}: {job['id']}\n",
+        f"{'Command':<12}: {command[:60]}{'...' if len(command) > 60 else ''}\n",
+        f"{'Status':<12}: ",
+        _STATUS_STYLED.get(status) or click.style(status, fg='white'), "\n",
+        f"{'Priority':<12}: {job['priority']}\n",
+        f"{'Timeout':<12}: {job['timeout']}s\n",
+        f"{'Created':<12}: {format_timestamp(job.get('created_at'))}\n",
+        f"{'Started':<12}: {format_timestamp(job.get('started_at'))}\n",
+        f"{'Completed':<12}: {format_timestamp(job.get('completed_at'))}\n",
+    ]
+
     # Calculate duration
     if job.get('started_at') and job.get('completed_at'):
-        from datetime import datetime
         try:
-            start = datetime.fromisoformat(job['started_at'].replace('Z', '+00:00'))
-            end = datetime.fromisoformat(job['completed_at'].replace('Z', '+00:00'))
-            duration = end - start
-            click.echo(f"{'Duration':<12}: {duration}")
-        except:
+            start = _parse_ts(job['started_at'])
+            end = _parse_ts(job['completed_at'])
+            parts.append(f"{'Duration':<12}: {end - start}\n")
+        except (ValueError, AttributeError, TypeError):
             pass
-    
+
     # Output sections
     if job.get("stdout"):
-        click.echo("\n📤 STDOUT:")
-        click.echo("─" * 20)
-        click.secho(job["stdout"], fg="green")
+        parts.append("\n📤 STDOUT:\n" + "─" * 20 + "\n")
+        parts.append(click.style(job["stdout"], fg="green") + "\n")
     else:
-        click.echo("\n📤 STDOUT: (empty)")
-    
+        parts.append("\n📤 STDOUT: (empty)\n")
+
     if job.get("stderr"):
-        click.echo("\n📥 STDERR:")
-        click.echo("─" * 20)
-        click.secho(job["stderr"], fg="red")
+        parts.append("\n📥 STDERR:\n" + "─" * 20 + "\n")
+        parts.append(click.style(job["stderr"], fg="red") + "\n")
     else:
-        click.echo("\n📥 STDERR: (empty)")
+        parts.append("\n📥 STDERR: (empty)\n")
+
+    click.echo("".join(parts), nl=False)